@@ -30,7 +30,7 @@ def generate_entity_xml(entity_name, attributes, generalization=None):
     if generalization:
         generalization_xml = f'<generalization>System.{generalization}</generalization>'
     
-    attributes_xml = ""
+    attribute_parts = []
     for attr in attributes:
         attr_type = attr['type']
         attr_name = attr['name']
@@ -49,23 +49,24 @@ def generate_entity_xml(entity_name, attributes, generalization=None):
         mendix_type = type_mapping.get(attr_type, 'String')
         
         if mendix_type == 'String':
-            attributes_xml += f"""
+            attribute_parts.append(f"""
         <attribute name="{attr_name}" type="{mendix_type}">
             <documentation>{attr_desc}</documentation>
             <value></value>
-        </attribute>"""
+        </attribute>""")
         elif mendix_type == 'Enumeration':
             enum_name = attr.get('enum_name', f'{attr_name}Enum')
-            attributes_xml += f"""
+            attribute_parts.append(f"""
         <attribute name="{attr_name}" type="{mendix_type}">
             <documentation>{attr_desc}</documentation>
             <enumeration>{enum_name}</enumeration>
-        </attribute>"""
+        </attribute>""")
         else:
-            attributes_xml += f"""
+            attribute_parts.append(f"""
         <attribute name="{attr_name}" type="{mendix_type}">
             <documentation>{attr_desc}</documentation>
-        </attribute>"""
+        </attribute>""")
+    attributes_xml = "".join(attribute_parts)
     
     xml_content = f"""<?xml version="1.0" encoding="UTF-8"?>
 <entity xmlns="http://www.mendix.com/metamodel/Domain/7.0.0" 
@@ -86,12 +87,10 @@ def generate_entity_xml(entity_name, attributes, generalization=None):
 def generate_enumeration_xml(enum_name, values):
     """Generate XML for enumeration compatible with Mendix 10.18.1"""
     
-    values_xml = ""
-    for value in values:
-        values_xml += f"""
+    values_xml = "".join(f"""
         <value name="{value['name']}">
             <caption defaultValue="{value['caption']}"/>
-        </value>"""
+        </value>""" for value in values)
     
     xml_content = f"""<?xml version="1.0" encoding="UTF-8"?>
 <enumeration xmlns="http://www.mendix.com/metamodel/Domain/7.0.0" 
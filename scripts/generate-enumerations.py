@@ -11,26 +11,37 @@ import argparse
 import sys
 from datetime import datetime
 
+MENDIX_XML_HEADER = '<?xml version="1.0" encoding="UTF-8"?>\n'
+
+# Use the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as YAML_LOADER
+except ImportError:
+    from yaml import SafeLoader as YAML_LOADER
+
+# Fallback configuration locations tried after the --config path
+ALT_CONFIG_PATHS = (
+    "config/lab-workflow-config.yaml",
+    "config/domain-model-config.yaml",
+    "../config/lab-workflow-config.yaml"
+)
+
 def load_config(config_path):
     """Load configuration from YAML file with fallback"""
+    if YAML_LOADER is yaml.SafeLoader:
+        print("⚠️ libyaml not available, falling back to the slower pure-Python YAML loader")
     try:
-        # Try the specified path first
-        if Path(config_path).exists():
-            with open(config_path, 'r', encoding='utf-8') as file:
-                return yaml.safe_load(file)
-        
-        # Try alternative paths
-        alternative_paths = [
-            Path("config/lab-workflow-config.yaml"),
-            Path("config/domain-model-config.yaml"),
-            Path("../config/lab-workflow-config.yaml")
-        ]
-        
-        for alt_path in alternative_paths:
-            if alt_path.exists():
-                print(f"📁 Using configuration from: {alt_path}")
-                with open(alt_path, 'r', encoding='utf-8') as file:
-                    return yaml.safe_load(file)
+        # Try the specified path first, then the alternatives. Each candidate is
+        # opened once and its raw bytes go straight to the YAML loader.
+        for candidate in (config_path, *ALT_CONFIG_PATHS):
+            try:
+                with open(candidate, 'rb') as file:
+                    data = file.read()
+            except (FileNotFoundError, IsADirectoryError):
+                continue
+            if candidate != config_path:
+                print(f"📁 Using configuration from: {candidate}")
+            return yaml.load(data, Loader=YAML_LOADER)
         
         # If no config found, provide default enumerations
         print("⚠️ No configuration file found, using default enumerations")
@@ -184,20 +195,24 @@ def generate_enumeration_xml(enum_config):
         print(f"❌ Error creating enumeration XML for {enum_config.get('name', 'unknown')}: {e}")
         return None
 
-def create_mendix_xml_header():
-    """Create proper Mendix XML header"""
-    return '<?xml version="1.0" encoding="UTF-8"?>\n'
-
-def format_xml_output(element):
-    """Format XML with proper indentation"""
-    from xml.dom import minidom
-    rough_string = ET.tostring(element, encoding='unicode')
-    reparsed = minidom.parseString(rough_string)
-    return reparsed.toprettyxml(indent="  ").split('\n', 1)[1]  # Remove first line
+def write_xml_file(element, file_path):
+    """Write an element to file with the Mendix XML header and proper indentation"""
+    # Text mode keeps the platform's line endings (CRLF on Windows)
+    with open(file_path, 'w', encoding='utf-8') as f:
+        f.write(MENDIX_XML_HEADER)
+        if hasattr(ET, 'indent'):
+            ET.indent(element, space="  ")
+            ET.ElementTree(element).write(f, encoding='unicode')
+            f.write('\n')
+        else:
+            # ET.indent is new in Python 3.9; pretty-print through minidom on 3.8
+            from xml.dom import minidom
+            pretty = minidom.parseString(ET.tostring(element)).toprettyxml(indent="  ")
+            f.write(pretty.split('\n', 1)[1])  # Remove first line
 
 def create_enumerations_summary(enums_config):
     """Create a markdown summary of all enumerations"""
-    summary = """# LAB Workflow Enumerations Summary
+    parts = ["""# LAB Workflow Enumerations Summary
 
 Generated on: {timestamp}
 
@@ -205,29 +220,29 @@ Generated on: {timestamp}
 
 This document lists all enumerations used in the LAB Product Validation Workflow system.
 
-""".format(timestamp=datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+""".format(timestamp=datetime.now().strftime("%Y-%m-%d %H:%M:%S"))]
     
     for enum in enums_config:
-        summary += f"### 📊 {enum['name']}\n\n"
-        summary += f"**Description:** {enum.get('description', 'No description')}\n\n"
+        parts.append(f"### 📊 {enum['name']}\n\n")
+        parts.append(f"**Description:** {enum.get('description', 'No description')}\n\n")
         
         if 'values' in enum and enum['values']:
-            summary += "**Values:**\n\n"
-            summary += "| Name | Caption | Description |\n"
-            summary += "|------|---------|-------------|\n"
+            parts.append("**Values:**\n\n"
+                         "| Name | Caption | Description |\n"
+                         "|------|---------|-------------|\n")
             
             for value in enum['values']:
                 name = value.get('name', 'Unknown')
                 caption = value.get('caption', name)
                 description = value.get('description', 'No description')
-                summary += f"| `{name}` | {caption} | {description} |\n"
+                parts.append(f"| `{name}` | {caption} | {description} |\n")
             
-            summary += "\n"
+            parts.append("\n")
         
-        summary += "---\n\n"
+        parts.append("---\n\n")
     
     # Add usage examples
-    summary += """## Usage Examples
+    parts.append("""## Usage Examples
 
 ### In Domain Model Attributes
 
@@ -281,9 +296,9 @@ components:
 - Dropdown widgets automatically populate with enumeration values
 - Consider adding new values to existing enumerations rather than creating new ones
 
-"""
+""")
     
-    return summary
+    return "".join(parts)
 
 def main():
     """Main function to generate enumerations"""
@@ -309,7 +324,8 @@ def main():
     # Create output directory
     output_path = Path(args.output)
     output_path.mkdir(parents=True, exist_ok=True)
-    print(f"📁 Created output directory: {output_path.absolute()}")
+    absolute_output = output_path.absolute()
+    print(f"📁 Created output directory: {absolute_output}")
     
     # Load configuration
     config = load_config(args.config)
@@ -336,9 +352,7 @@ def main():
                     # Save to file with proper formatting
                     enum_file = output_path / f"{enum_name}.xml"
                     
-                    with open(enum_file, 'w', encoding='utf-8') as f:
-                        f.write(create_mendix_xml_header())
-                        f.write(format_xml_output(enum_xml))
+                    write_xml_file(enum_xml, enum_file)
                     
                     print(f"✅ Generated: {enum_name}.xml")
                     generated_count += 1
@@ -363,7 +377,7 @@ def main():
         print("⚠️ No enumerations found in configuration")
     
     print("🎉 Enumerations generation completed!")
-    print(f"📁 Files saved to: {output_path.absolute()}")
+    print(f"📁 Files saved to: {absolute_output}")
     return 0
 
 if __name__ == "__main__":
@@ -30,18 +30,17 @@ def generate_microflow_xml(name, description, parameters=None, return_type="Bool
     security_roles = security_roles or ["LABAdmin", "LABTechnician"]
     
     # Generate parameters XML
-    params_xml = ""
+    param_parts = []
     for param in parameters:
         param_name = param.get('name', 'Parameter')
         param_type = param.get('type', 'String')
-        params_xml += f"""
-        <parameter name="{param_name}" type="{param_type}"/>"""
+        param_parts.append(f"""
+        <parameter name="{param_name}" type="{param_type}"/>""")
+    params_xml = "".join(param_parts)
     
     # Generate security roles XML
-    roles_xml = ""
-    for role in security_roles:
-        roles_xml += f"""
-        <allowedRole name="{role}"/>"""
+    roles_xml = "".join(f"""
+        <allowedRole name="{role}"/>""" for role in security_roles)
     
     xml_content = f"""<?xml version="1.0" encoding="UTF-8"?>
 <microflow xmlns="http://www.mendix.com/metamodel/MicroFlows/7.0.0" 
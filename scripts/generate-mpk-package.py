@@ -7,6 +7,7 @@ Creates a Mendix Package (MPK) file from generated XML components
 import zipfile
 import json
 import xml.etree.ElementTree as ET
+from xml.dom import minidom
 from pathlib import Path
 import argparse
 import sys
@@ -101,7 +102,6 @@ def create_mpk_package(output_dir, mpk_filename):
         
         # Add module XML
         module_xml = create_module_xml()
-        from xml.dom import minidom
         rough_string = ET.tostring(module_xml, encoding='unicode')
         reparsed = minidom.parseString(rough_string)
         formatted_xml = reparsed.toprettyxml(indent="  ")
@@ -4,33 +4,85 @@ LAB Product Validation Workflow - Pages Generator
 Generates role-specific pages with appropriate access controls and functionality
 """
 
+import os
+import re
 import yaml
-import xml.etree.ElementTree as ET
+import pickle
+import hashlib
 from pathlib import Path
+from string import Template
 import argparse
 import sys
+import traceback
 from datetime import datetime
+from itertools import repeat
+
+# Pages are rendered in a process pool only from this many pages upwards;
+# smaller configurations are faster serially
+PARALLEL_MIN_PAGES = 500
+
+# Parsed configurations are cached under the home directory, keyed by the hash
+# of the YAML content. The home directory is resolved on use, not at import,
+# because it may be unknown and the cache is only best-effort.
+CONFIG_CACHE_SUBDIR = Path(".cache") / "lab-workflow"
+CONFIG_CACHE_MAX_ENTRIES = 32
+
+def prune_config_cache(cache_dir):
+    """Keep only the most recently used cached configurations"""
+    entries = sorted(cache_dir.glob("*.pkl"), key=lambda p: p.stat().st_mtime, reverse=True)
+    for stale in entries[CONFIG_CACHE_MAX_ENTRIES:]:
+        stale.unlink(missing_ok=True)
+
+def load_yaml_cached(config_path):
+    """Parse a YAML file, reusing a pickled copy when the content is unchanged"""
+    data = Path(config_path).read_bytes()
+    cache_file = None
+    
+    try:
+        cache_file = Path.home() / CONFIG_CACHE_SUBDIR / f"{hashlib.blake2b(data).hexdigest()}.pkl"
+        with open(cache_file, 'rb') as file:
+            config = pickle.load(file)
+    except Exception:
+        pass  # No home directory, or a missing or unreadable cache entry
+    else:
+        try:
+            os.utime(cache_file)  # Mark as recently used
+        except OSError:
+            pass  # A read-only cache still serves hits
+        return config
+    
+    config = yaml.load(data, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
+    if cache_file is None:
+        return config
+    
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_file, 'wb') as file:
+            pickle.dump(config, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)
+        prune_config_cache(cache_file.parent)
+    except OSError:
+        pass  # Caching is best-effort
+    
+    return config
 
 def load_config(config_path):
     """Load configuration from YAML file with fallback"""
     try:
-        # Try the specified path first
-        if Path(config_path).exists():
-            with open(config_path, 'r', encoding='utf-8') as file:
-                return yaml.safe_load(file)
-        
-        # Try alternative paths
-        alternative_paths = [
-            Path("config/lab-workflow-config.yaml"),
-            Path("config/domain-model-config.yaml"),
-            Path("../config/lab-workflow-config.yaml")
-        ]
+        # Try the specified path first, then the alternative locations
+        candidates = (
+            config_path,
+            "config/lab-workflow-config.yaml",
+            "config/domain-model-config.yaml",
+            "../config/lab-workflow-config.yaml"
+        )
+        path = next((p for p in candidates if os.path.isfile(p)), None)
         
-        for alt_path in alternative_paths:
-            if alt_path.exists():
-                print(f"📁 Using configuration from: {alt_path}")
-                with open(alt_path, 'r', encoding='utf-8') as file:
-                    return yaml.safe_load(file)
+        if path is not None:
+            if path != config_path:
+                print(f"📁 Using configuration from: {path}")
+            return load_yaml_cached(path)
         
         # If no config found, provide default pages
         print("⚠️ No configuration file found, using default pages")
@@ -40,202 +92,241 @@ def load_config(config_path):
         print(f"❌ Error loading configuration: {e}")
         return None
 
+# Default pages used when no configuration file is found, returned as-is by
+# get_default_pages_config
+DEFAULT_PAGES_CONFIG = {
+    'pages': [
+        {
+            'name': 'WorkflowAdminCenter',
+            'type': 'admin_dashboard',
+            'description': 'Central administration hub for workflow management',
+            'security_roles': ['LABAdmin'],
+            'layout': 'Dashboard',
+            'components': [
+                {'type': 'DataGrid', 'entity': 'System.Workflow', 'title': 'All Workflows'},
+                {'type': 'DataGrid', 'entity': 'System.WorkflowUserTask', 'title': 'All Tasks'},
+                {'type': 'ActionButton', 'action': 'ACT_AssignTask', 'title': 'Reassign Task'},
+                {'type': 'Chart', 'data': 'WorkflowMetrics', 'title': 'Workflow Performance'}
+            ]
+        },
+        {
+            'name': 'TaskInbox',
+            'type': 'user_dashboard',
+            'description': 'Personal task management interface for users',
+            'security_roles': ['LABTechnician'],
+            'layout': 'TaskManagement',
+            'components': [
+                {'type': 'DataGrid', 'entity': 'System.WorkflowUserTask', 'title': 'My Tasks', 'constraint': '[AssignedTo = $currentUser]'},
+                {'type': 'ActionButton', 'action': 'ACT_CompleteTask', 'title': 'Complete Task'},
+                {'type': 'FormView', 'entity': 'ProductValidation', 'title': 'Task Details'}
+            ]
+        },
+        {
+            'name': 'TaskDashboard',
+            'type': 'user_dashboard',
+            'description': 'Personal performance metrics and task history',
+            'security_roles': ['LABTechnician'],
+            'layout': 'Dashboard',
+            'components': [
+                {'type': 'Chart', 'data': 'MyTaskMetrics', 'title': 'My Performance'},
+                {'type': 'DataGrid', 'entity': 'System.WorkflowEndedUserTask', 'title': 'Completed Tasks', 'constraint': '[CompletedBy = $currentUser]'},
+                {'type': 'StatCard', 'metric': 'TasksCompleted', 'title': 'Tasks Completed This Week'}
+            ]
+        },
+        {
+            'name': 'PublicDashboard',
+            'type': 'viewer_dashboard',
+            'description': 'Read-only dashboard for public workflow information',
+            'security_roles': ['LABViewer'],
+            'layout': 'ReadOnlyDashboard',
+            'components': [
+                {'type': 'Chart', 'data': 'PublicWorkflowMetrics', 'title': 'Workflow Statistics'},
+                {'type': 'DataGrid', 'entity': 'ValidationReport', 'title': 'Public Reports', 'constraint': '[IsPublic = true]'},
+                {'type': 'StatCard', 'metric': 'TotalWorkflows', 'title': 'Total Workflows'}
+            ]
+        },
+        {
+            'name': 'ImageAcquisitionTask',
+            'type': 'task_page',
+            'description': 'Specialized page for image capture and quality validation',
+            'security_roles': ['LABTechnician'],
+            'layout': 'TaskForm',
+            'components': [
+                {'type': 'ImageUploader', 'entity': 'ImageAcquisition', 'field': 'ImageFile', 'title': 'Upload Image'},
+                {'type': 'FormView', 'entity': 'ImageAcquisition', 'title': 'Image Details'},
+                {'type': 'ActionButton', 'action': 'ACT_ProcessImageQuality', 'title': 'Validate Quality'},
+                {'type': 'ConditionalView', 'condition': 'IsQualityApproved', 'title': 'Quality Status'}
+            ]
+        },
+        {
+            'name': 'DetailedImageAcquisitionTask',
+            'type': 'task_page',
+            'description': 'Enhanced image processing and analysis interface',
+            'security_roles': ['LABTechnician'],
+            'layout': 'TaskForm',
+            'components': [
+                {'type': 'ImageViewer', 'entity': 'DetailedImageAcquisition', 'field': 'EnhancedImageFile', 'title': 'Enhanced Image'},
+                {'type': 'FormView', 'entity': 'DetailedImageAcquisition', 'title': 'Processing Details'},
+                {'type': 'TextArea', 'field': 'ProcessingNotes', 'title': 'Processing Notes'},
+                {'type': 'ActionButton', 'action': 'ACT_CompleteTask', 'title': 'Complete Processing'}
+            ]
+        },
+        {
+            'name': 'ValidationResultPage',
+            'type': 'task_page',
+            'description': 'Final validation decision interface',
+            'security_roles': ['LABAdmin'],
+            'layout': 'ValidationForm',
+            'components': [
+                {'type': 'FormView', 'entity': 'ValidationResult', 'title': 'Validation Decision'},
+                {'type': 'DropDown', 'field': 'Result', 'enumeration': 'ValidationOutcome', 'title': 'Final Decision'},
+                {'type': 'TextArea', 'field': 'Comments', 'title': 'Validation Comments'},
+                {'type': 'ActionButton', 'action': 'ACT_ValidateWorkflowOutcome', 'title': 'Submit Decision'}
+            ]
+        },
+        {
+            'name': 'ReportGenerationPage',
+            'type': 'report_page',
+            'description': 'Comprehensive report generation and viewing',
+            'security_roles': ['LABAdmin', 'LABTechnician', 'LABViewer'],
+            'layout': 'ReportLayout',
+            'components': [
+                {'type': 'FormView', 'entity': 'ValidationReport', 'title': 'Report Configuration'},
+                {'type': 'DropDown', 'field': 'ReportFormat', 'enumeration': 'ReportFormat', 'title': 'Report Format'},
+                {'type': 'ActionButton', 'action': 'ACT_GenerateValidationReport', 'title': 'Generate Report'},
+                {'type': 'FileDownloader', 'field': 'ReportFile', 'title': 'Download Report'}
+            ]
+        },
+        {
+            'name': 'AuditTrailViewer',
+            'type': 'admin_page',
+            'description': 'Complete audit trail viewer for compliance tracking',
+            'security_roles': ['LABAdmin'],
+            'layout': 'AuditLayout',
+            'components': [
+                {'type': 'DataGrid', 'entity': 'WorkflowAuditTrail', 'title': 'Audit Trail'},
+                {'type': 'SearchBox', 'target': 'AuditTrail', 'title': 'Search Actions'},
+                {'type': 'DatePicker', 'field': 'ActionDate', 'title': 'Filter by Date'},
+                {'type': 'ExportButton', 'data': 'AuditTrail', 'title': 'Export Audit Log'}
+            ]
+        },
+        {
+            'name': 'UserManagement',
+            'type': 'admin_page',
+            'description': 'User and role management interface',
+            'security_roles': ['LABAdmin'],
+            'layout': 'UserManagement',
+            'components': [
+                {'type': 'DataGrid', 'entity': 'Administration.Account', 'title': 'Users'},
+                {'type': 'FormView', 'entity': 'Administration.Account', 'title': 'User Details'},
+                {'type': 'RoleSelector', 'field': 'UserRoles', 'title': 'Assign Roles'},
+                {'type': 'ActionButton', 'action': 'ACT_UpdateUserRoles', 'title': 'Update Roles'}
+            ]
+        }
+    ]
+}
+
 def get_default_pages_config():
     """Return default pages configuration"""
-    return {
-        'pages': [
-            {
-                'name': 'WorkflowAdminCenter',
-                'type': 'admin_dashboard',
-                'description': 'Central administration hub for workflow management',
-                'security_roles': ['LABAdmin'],
-                'layout': 'Dashboard',
-                'components': [
-                    {'type': 'DataGrid', 'entity': 'System.Workflow', 'title': 'All Workflows'},
-                    {'type': 'DataGrid', 'entity': 'System.WorkflowUserTask', 'title': 'All Tasks'},
-                    {'type': 'ActionButton', 'action': 'ACT_AssignTask', 'title': 'Reassign Task'},
-                    {'type': 'Chart', 'data': 'WorkflowMetrics', 'title': 'Workflow Performance'}
-                ]
-            },
-            {
-                'name': 'TaskInbox',
-                'type': 'user_dashboard',
-                'description': 'Personal task management interface for users',
-                'security_roles': ['LABTechnician'],
-                'layout': 'TaskManagement',
-                'components': [
-                    {'type': 'DataGrid', 'entity': 'System.WorkflowUserTask', 'title': 'My Tasks', 'constraint': '[AssignedTo = $currentUser]'},
-                    {'type': 'ActionButton', 'action': 'ACT_CompleteTask', 'title': 'Complete Task'},
-                    {'type': 'FormView', 'entity': 'ProductValidation', 'title': 'Task Details'}
-                ]
-            },
-            {
-                'name': 'TaskDashboard',
-                'type': 'user_dashboard',
-                'description': 'Personal performance metrics and task history',
-                'security_roles': ['LABTechnician'],
-                'layout': 'Dashboard',
-                'components': [
-                    {'type': 'Chart', 'data': 'MyTaskMetrics', 'title': 'My Performance'},
-                    {'type': 'DataGrid', 'entity': 'System.WorkflowEndedUserTask', 'title': 'Completed Tasks', 'constraint': '[CompletedBy = $currentUser]'},
-                    {'type': 'StatCard', 'metric': 'TasksCompleted', 'title': 'Tasks Completed This Week'}
-                ]
-            },
-            {
-                'name': 'PublicDashboard',
-                'type': 'viewer_dashboard',
-                'description': 'Read-only dashboard for public workflow information',
-                'security_roles': ['LABViewer'],
-                'layout': 'ReadOnlyDashboard',
-                'components': [
-                    {'type': 'Chart', 'data': 'PublicWorkflowMetrics', 'title': 'Workflow Statistics'},
-                    {'type': 'DataGrid', 'entity': 'ValidationReport', 'title': 'Public Reports', 'constraint': '[IsPublic = true]'},
-                    {'type': 'StatCard', 'metric': 'TotalWorkflows', 'title': 'Total Workflows'}
-                ]
-            },
-            {
-                'name': 'ImageAcquisitionTask',
-                'type': 'task_page',
-                'description': 'Specialized page for image capture and quality validation',
-                'security_roles': ['LABTechnician'],
-                'layout': 'TaskForm',
-                'components': [
-                    {'type': 'ImageUploader', 'entity': 'ImageAcquisition', 'field': 'ImageFile', 'title': 'Upload Image'},
-                    {'type': 'FormView', 'entity': 'ImageAcquisition', 'title': 'Image Details'},
-                    {'type': 'ActionButton', 'action': 'ACT_ProcessImageQuality', 'title': 'Validate Quality'},
-                    {'type': 'ConditionalView', 'condition': 'IsQualityApproved', 'title': 'Quality Status'}
-                ]
-            },
-            {
-                'name': 'DetailedImageAcquisitionTask',
-                'type': 'task_page',
-                'description': 'Enhanced image processing and analysis interface',
-                'security_roles': ['LABTechnician'],
-                'layout': 'TaskForm',
-                'components': [
-                    {'type': 'ImageViewer', 'entity': 'DetailedImageAcquisition', 'field': 'EnhancedImageFile', 'title': 'Enhanced Image'},
-                    {'type': 'FormView', 'entity': 'DetailedImageAcquisition', 'title': 'Processing Details'},
-                    {'type': 'TextArea', 'field': 'ProcessingNotes', 'title': 'Processing Notes'},
-                    {'type': 'ActionButton', 'action': 'ACT_CompleteTask', 'title': 'Complete Processing'}
-                ]
-            },
-            {
-                'name': 'ValidationResultPage',
-                'type': 'task_page',
-                'description': 'Final validation decision interface',
-                'security_roles': ['LABAdmin'],
-                'layout': 'ValidationForm',
-                'components': [
-                    {'type': 'FormView', 'entity': 'ValidationResult', 'title': 'Validation Decision'},
-                    {'type': 'DropDown', 'field': 'Result', 'enumeration': 'ValidationOutcome', 'title': 'Final Decision'},
-                    {'type': 'TextArea', 'field': 'Comments', 'title': 'Validation Comments'},
-                    {'type': 'ActionButton', 'action': 'ACT_ValidateWorkflowOutcome', 'title': 'Submit Decision'}
-                ]
-            },
-            {
-                'name': 'ReportGenerationPage',
-                'type': 'report_page',
-                'description': 'Comprehensive report generation and viewing',
-                'security_roles': ['LABAdmin', 'LABTechnician', 'LABViewer'],
-                'layout': 'ReportLayout',
-                'components': [
-                    {'type': 'FormView', 'entity': 'ValidationReport', 'title': 'Report Configuration'},
-                    {'type': 'DropDown', 'field': 'ReportFormat', 'enumeration': 'ReportFormat', 'title': 'Report Format'},
-                    {'type': 'ActionButton', 'action': 'ACT_GenerateValidationReport', 'title': 'Generate Report'},
-                    {'type': 'FileDownloader', 'field': 'ReportFile', 'title': 'Download Report'}
-                ]
-            },
-            {
-                'name': 'AuditTrailViewer',
-                'type': 'admin_page',
-                'description': 'Complete audit trail viewer for compliance tracking',
-                'security_roles': ['LABAdmin'],
-                'layout': 'AuditLayout',
-                'components': [
-                    {'type': 'DataGrid', 'entity': 'WorkflowAuditTrail', 'title': 'Audit Trail'},
-                    {'type': 'SearchBox', 'target': 'AuditTrail', 'title': 'Search Actions'},
-                    {'type': 'DatePicker', 'field': 'ActionDate', 'title': 'Filter by Date'},
-                    {'type': 'ExportButton', 'data': 'AuditTrail', 'title': 'Export Audit Log'}
-                ]
-            },
-            {
-                'name': 'UserManagement',
-                'type': 'admin_page',
-                'description': 'User and role management interface',
-                'security_roles': ['LABAdmin'],
-                'layout': 'UserManagement',
-                'components': [
-                    {'type': 'DataGrid', 'entity': 'Administration.Account', 'title': 'Users'},
-                    {'type': 'FormView', 'entity': 'Administration.Account', 'title': 'User Details'},
-                    {'type': 'RoleSelector', 'field': 'UserRoles', 'title': 'Assign Roles'},
-                    {'type': 'ActionButton', 'action': 'ACT_UpdateUserRoles', 'title': 'Update Roles'}
-                ]
-            }
-        ]
-    }
+    return DEFAULT_PAGES_CONFIG
+
+# Page XML templates, compiled once at import
+MENDIX_XML_HEADER = '<?xml version="1.0" encoding="UTF-8"?>\n'
+PAGE_OPEN_TEMPLATE = Template('<page name="$name" type="$type">\n')
+PAGE_EMPTY_TEMPLATE = Template('<page name="$name" type="$type" />\n')
+DOCUMENTATION_TEMPLATE = Template('  <documentation>$text</documentation>\n')
+ALLOWED_ROLE_TEMPLATE = Template('    <allowedRole name="$name" />\n')
+LAYOUT_TEMPLATE = Template('  <layout type="$type" />\n')
+COMPONENT_TEMPLATE = Template('    <component $attributes />\n')
+
+# Optional component attributes, emitted in this order when present
+COMPONENT_ATTRIBUTES = ('entity', 'field', 'action', 'constraint', 'enumeration')
+
+# Matches attribute values that contain nothing needing escaping, which covers
+# the page names, entities and fields making up most component attributes
+SAFE_ATTRIBUTE = re.compile(r'[^&<>"\n\r\t]*').fullmatch
+
+def escape(value):
+    """Escape &, < and > for use in XML character data"""
+    return value.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+
+def escape_attribute(value):
+    """Escape a value for use inside a double-quoted XML attribute"""
+    value = str(value)
+    if SAFE_ATTRIBUTE(value):
+        return value
+    return (escape(value).replace('"', '&quot;').replace('\n', '&#10;')
+            .replace('\r', '&#13;').replace('\t', '&#09;'))
 
 def generate_page_xml(page_config):
-    """Generate XML for a single page"""
-    try:
-        # Create root page element
-        page = ET.Element("page")
-        page.set("name", page_config.get('name', 'UnknownPage'))
-        page.set("type", page_config.get('type', 'page'))
-        
-        # Add documentation
-        if 'description' in page_config:
-            documentation = ET.SubElement(page, "documentation")
-            documentation.text = page_config['description']
-        
-        # Add security settings
-        if 'security_roles' in page_config:
-            security_elem = ET.SubElement(page, "security")
-            for role in page_config['security_roles']:
-                role_elem = ET.SubElement(security_elem, "allowedRole")
-                role_elem.set("name", role)
-        
-        # Add layout
-        if 'layout' in page_config:
-            layout_elem = ET.SubElement(page, "layout")
-            layout_elem.set("type", page_config['layout'])
-        
-        # Add components
-        if 'components' in page_config and page_config['components']:
-            components_elem = ET.SubElement(page, "components")
+    """Generate XML for a single page as a list of fragments ready to be streamed to a file"""
+    name = escape_attribute(page_config.get('name', 'UnknownPage'))
+    page_type = escape_attribute(page_config.get('type', 'page'))
+    
+    # A page without any content collapses to a self-closing element
+    if ('description' not in page_config and 'security_roles' not in page_config
+            and 'layout' not in page_config and not page_config.get('components')):
+        return [PAGE_EMPTY_TEMPLATE.substitute(name=name, type=page_type)]
+    
+    fragments = [PAGE_OPEN_TEMPLATE.substitute(name=name, type=page_type)]
+    
+    # Add documentation
+    if 'description' in page_config:
+        if page_config['description']:
+            fragments.append(DOCUMENTATION_TEMPLATE.substitute(text=escape(str(page_config['description']))))
+        else:
+            fragments.append('  <documentation />\n')
+    
+    # Add security settings
+    if 'security_roles' in page_config:
+        if page_config['security_roles']:
+            fragments.append('  <security>\n')
+            fragments.extend(ALLOWED_ROLE_TEMPLATE.substitute(name=escape_attribute(role))
+                             for role in page_config['security_roles'])
+            fragments.append('  </security>\n')
+        else:
+            fragments.append('  <security />\n')
+    
+    # Add layout
+    if 'layout' in page_config:
+        fragments.append(LAYOUT_TEMPLATE.substitute(type=escape_attribute(page_config['layout'])))
+    
+    # Add components
+    if 'components' in page_config and page_config['components']:
+        fragments.append('  <components>\n')
+        for component in page_config['components']:
+            # Common attributes first, then the component-specific ones that are present
+            attributes = {
+                'type': component.get('type', 'Unknown'),
+                'title': component.get('title', 'Untitled')
+            }
+            attributes.update((key, component[key]) for key in COMPONENT_ATTRIBUTES
+                              if component.get(key) is not None)
             
-            for component in page_config['components']:
-                comp_elem = ET.SubElement(components_elem, "component")
-                comp_elem.set("type", component.get('type', 'Unknown'))
-                comp_elem.set("title", component.get('title', 'Untitled'))
-                
-                # Add component-specific attributes
-                if 'entity' in component:
-                    comp_elem.set("entity", component['entity'])
-                if 'field' in component:
-                    comp_elem.set("field", component['field'])
-                if 'action' in component:
-                    comp_elem.set("action", component['action'])
-                if 'constraint' in component:
-                    comp_elem.set("constraint", component['constraint'])
-                if 'enumeration' in component:
-                    comp_elem.set("enumeration", component['enumeration'])
+            fragments.append(COMPONENT_TEMPLATE.substitute(
+                attributes=" ".join(f'{key}="{escape_attribute(value)}"' for key, value in attributes.items())
+            ))
+        fragments.append('  </components>\n')
+    
+    fragments.append('</page>\n')
+    return fragments
+
+def render_page(page_config, output_path):
+    """Generate and save a single page, returning (page_name, error, traceback)"""
+    page_name = page_config.get('name', 'Unknown')
+    try:
+        # Create page XML
+        page_xml = generate_page_xml(page_config)
         
-        return page
+        # Save to file with proper formatting
+        page_file = output_path / f"{page_name}.xml"
+        with open(page_file, 'w', encoding='utf-8') as f:
+            f.write(MENDIX_XML_HEADER)
+            f.writelines(page_xml)
+        return page_name, None, None
         
     except Exception as e:
-        print(f"❌ Error creating page XML for {page_config.get('name', 'unknown')}: {e}")
-        return None
-
-def create_mendix_xml_header():
-    """Create proper Mendix XML header"""
-    return '<?xml version="1.0" encoding="UTF-8"?>\n'
-
-def format_xml_output(element):
-    """Format XML with proper indentation"""
-    from xml.dom import minidom
-    rough_string = ET.tostring(element, encoding='unicode')
-    reparsed = minidom.parseString(rough_string)
-    return reparsed.toprettyxml(indent="  ").split('\n', 1)[1]  # Remove first line
+        return page_name, f"Error generating {page_name}: {e}", traceback.format_exc()
 
 def main():
     """Main function to generate pages"""
@@ -261,7 +352,8 @@ def main():
     # Create output directory
     output_path = Path(args.output)
     output_path.mkdir(parents=True, exist_ok=True)
-    print(f"📁 Created output directory: {output_path.absolute()}")
+    absolute_output = output_path.absolute()
+    print(f"📁 Created output directory: {absolute_output}")
     
     # Load configuration
     config = load_config(args.config)
@@ -276,39 +368,31 @@ def main():
     if 'pages' in config and config['pages']:
         print(f"📄 Found {len(config['pages'])} pages to generate")
         
+        pages = config['pages']
+        if len(pages) >= PARALLEL_MIN_PAGES:
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor() as executor:
+                results = list(executor.map(render_page, pages, repeat(output_path), chunksize=2))
+        else:
+            results = [render_page(page_config, output_path) for page_config in pages]
+        
         generated_count = 0
-        for page_config in config['pages']:
-            try:
-                page_name = page_config.get('name', 'Unknown')
-                print(f"🔨 Generating: {page_name}")
-                
-                # Create page XML
-                page_xml = generate_page_xml(page_config)
-                if page_xml is not None:
-                    # Save to file with proper formatting
-                    page_file = output_path / f"{page_name}.xml"
-                    
-                    with open(page_file, 'w', encoding='utf-8') as f:
-                        f.write(create_mendix_xml_header())
-                        f.write(format_xml_output(page_xml))
-                    
-                    print(f"✅ Generated: {page_name}.xml")
-                    generated_count += 1
-                else:
-                    print(f"❌ Failed to generate XML for {page_name}")
-                    
-            except Exception as e:
-                print(f"❌ Error generating {page_config.get('name', 'unknown')}: {e}")
-                if args.debug:
-                    import traceback
-                    traceback.print_exc()
+        for page_name, error, details in results:
+            print(f"🔨 Generating: {page_name}")
+            if error is None:
+                print(f"✅ Generated: {page_name}.xml")
+                generated_count += 1
+            else:
+                print(f"❌ {error}")
+                if args.debug and details:
+                    print(details, end='')
         
         print(f"📈 Successfully generated {generated_count} pages")
     else:
         print("⚠️ No pages found in configuration")
     
     print("🎉 Pages generation completed!")
-    print(f"📁 Files saved to: {output_path.absolute()}")
+    print(f"📁 Files saved to: {absolute_output}")
     return 0
 
 if __name__ == "__main__":
@@ -320,6 +404,5 @@ if __name__ == "__main__":
         sys.exit(1)
     except Exception as e:
         print(f"❌ Unexpected error: {e}")
-        import traceback
         traceback.print_exc()
         sys.exit(1)
\ No newline at end of file
@@ -5,308 +5,367 @@ FIXED VERSION - Compatible with Mendix 10.18.1 and Workflow Commons 3.12.1
 """
 
 import os
+import re
 import sys
 import yaml
+import logging
 import argparse
+from collections import namedtuple
 from pathlib import Path
 from datetime import datetime
 
+MENDIX_XML_HEADER = '<?xml version="1.0" encoding="UTF-8"?>\n'
+PROJECTS_NAMESPACE = "http://www.mendix.com/metamodel/Projects/7.0.0"
+XSI_NAMESPACE = "http://www.w3.org/2001/XMLSchema-instance"
+
+# Module role XML templates; every role has the same fixed structure
+MODULE_ROLE_TEMPLATE = (
+    f'<moduleRole xmlns="{PROJECTS_NAMESPACE}" xmlns:xsi="{XSI_NAMESPACE}" name="{{name}}">\n'
+    '    <documentation>{description} - Compatible with Mendix 10.18.1</documentation>\n'
+)
+ENTITY_TEMPLATE = '        <entityAccess entity="{name}" access="{access}" />\n'
+ENTITY_XPATH_TEMPLATE = (
+    '        <entityAccess entity="{name}" access="{access}">\n'
+    '            <xPathConstraint>{xpath}</xPathConstraint>\n'
+    '        </entityAccess>\n'
+)
+PAGE_TEMPLATE = '        <pageAccess page="{name}" access="Full" />\n'
+MICROFLOW_TEMPLATE = '        <microflowAccess microflow="{name}" access="Full" />\n'
+
+log = logging.getLogger("securitygen")
+
+# Fixed-shape role definition; fields are read by attribute rather than dict lookup
+RoleSpec = namedtuple('RoleSpec', 'name description entity_access page_access microflow_access')
+
+# XPath constraints shared by several default entity rules
+XPATHS = {
+    'OWN_ACQUISITION': "[TechnicianID = '[%CurrentUser%]']",
+    'PROCESS_COMPLETED': "[ProductValidation/Status = 'Completed']"
+}
+
+# Security roles compatible with Mendix 10.18.1, built once at import
+SECURITY_ROLES = (
+    RoleSpec(
+        name="LABAdmin",
+        description="Full system administration and workflow management capabilities",
+        entity_access={
+            "ProductValidation": "CRUD",
+            "ImageAcquisition": "CRUD", 
+            "ImageQualityValidation": "CRUD",
+            "DetailedImageAcquisition": "CRUD",
+            "ImageAnalysis": "CRUD",
+            "KPIExtraction": "CRUD",
+            "ValidationResult": "CRUD",
+            "ValidationReport": "CRUD",
+            "WorkflowAuditTrail": "CRUD",
+            "System.WorkflowUserTask": "CRUD",
+            "System.Workflow": "CRUD",
+            "Administration.Account": "R"
+        },
+        page_access=(
+            "WorkflowAdminCenter",
+            "WorkflowAdminDashboard", 
+            "TaskAssignment_Management",
+            "UserManagement_Workflow",
+            "SystemConfiguration",
+            "AuditTrailViewer",
+            "TaskInbox",
+            "ValidationResultPage",
+            "ReportGenerationPage"
+        ),
+        microflow_access=(
+            "ACT_CreateTask",
+            "ACT_AssignTask", 
+            "ACT_CompleteTask",
+            "SUB_CheckUserPermissions",
+            "ACT_ProcessImageQuality",
+            "DS_GetMyTasks",
+            "ACT_InitiateWorkflow",
+            "ACT_GenerateValidationReport",
+            "ACT_UpdateAuditTrail",
+            "ACT_ValidateWorkflowOutcome",
+            "SUB_NotifyStakeholders",
+            "DS_GetWorkflowHistory",
+            "ACT_HandleWorkflowException",
+            "SUB_CalculateQualityMetrics",
+            "ACT_ArchiveCompletedWorkflow"
+        )
+    ),
+    RoleSpec(
+        name="LABTechnician", 
+        description="Task execution and data entry for assigned laboratory workflows",
+        entity_access={
+            "ProductValidation": "R",
+            "ImageAcquisition": {
+                "access": "CRUD",
+                "xpath": XPATHS['OWN_ACQUISITION']
+            },
+            "ImageQualityValidation": {
+                "access": "CRUD", 
+                "xpath": "[ValidatedBy = '[%CurrentUser%]']"
+            },
+            "DetailedImageAcquisition": {
+                "access": "CRUD",
+                "xpath": XPATHS['OWN_ACQUISITION']
+            },
+            "ImageAnalysis": {
+                "access": "CRUD",
+                "xpath": "[ProcessedBy = '[%CurrentUser%]']"
+            },
+            "KPIExtraction": {
+                "access": "CRUD",
+                "xpath": "[ExtractedBy = '[%CurrentUser%]']"
+            },
+            "ValidationResult": "R",
+            "ValidationReport": "R",
+            "WorkflowAuditTrail": {
+                "access": "R",
+                "xpath": "[PerformedBy = '[%CurrentUser%]']"
+            },
+            "System.WorkflowUserTask": {
+                "access": "RU",
+                "xpath": "[System.WorkflowUserTask_Account = '[%CurrentUser%]']"
+            },
+            "System.Workflow": "R",
+            "Administration.Account": "R"
+        },
+        page_access=(
+            "TaskInbox",
+            "TaskDashboard", 
+            "ImageAcquisitionTask",
+            "ImageQualityValidationTask",
+            "DetailedImageAcquisitionTask",
+            "ImageAnalysisTask",
+            "KPIExtractionTask",
+            "ReportGenerationPage"
+        ),
+        microflow_access=(
+            "ACT_CompleteTask",
+            "SUB_CheckUserPermissions",
+            "ACT_ProcessImageQuality",
+            "DS_GetMyTasks",
+            "ACT_InitiateWorkflow",
+            "ACT_GenerateValidationReport",
+            "ACT_UpdateAuditTrail",
+            "SUB_NotifyStakeholders",
+            "SUB_CalculateQualityMetrics"
+        )
+    ),
+    RoleSpec(
+        name="LABViewer",
+        description="Read-only access to completed workflows and public reports",
+        entity_access={
+            "ProductValidation": {
+                "access": "R",
+                "xpath": "[Status = 'Completed']"
+            },
+            "ImageAcquisition": {
+                "access": "R", 
+                "xpath": XPATHS['PROCESS_COMPLETED']
+            },
+            "ImageQualityValidation": {
+                "access": "R",
+                "xpath": "[ImageAcquisition/ProductValidation/Status = 'Completed']"
+            },
+            "DetailedImageAcquisition": {
+                "access": "R",
+                "xpath": XPATHS['PROCESS_COMPLETED']
+            },
+            "ImageAnalysis": {
+                "access": "R",
+                "xpath": XPATHS['PROCESS_COMPLETED']
+            },
+            "KPIExtraction": {
+                "access": "R",
+                "xpath": XPATHS['PROCESS_COMPLETED']
+            },
+            "ValidationResult": "R",
+            "ValidationReport": "R",
+            "WorkflowAuditTrail": {
+                "access": "R",
+                "xpath": XPATHS['PROCESS_COMPLETED']
+            },
+            "System.WorkflowUserTask": {
+                "access": "R",
+                "xpath": "[System.Workflow/System.Workflow_ProductValidation/Status = 'Completed']"
+            },
+            "System.Workflow": {
+                "access": "R",
+                "xpath": "[System.Workflow_ProductValidation/Status = 'Completed']"
+            },
+            "Administration.Account": "R"
+        },
+        page_access=(
+            "PublicReportViewer",
+            "WorkflowStatusViewer", 
+            "ValidationResultViewer",
+            "CompletedWorkflowsOverview"
+        ),
+        microflow_access=(
+            "SUB_CheckUserPermissions",
+            "DS_GetWorkflowHistory"
+        )
+    )
+)
+
 def load_config(config_path):
     """Load configuration from YAML file with proper error handling"""
     try:
         with open(config_path, 'r', encoding='utf-8') as file:
             return yaml.safe_load(file)
     except FileNotFoundError:
-        print(f"❌ Configuration file not found: {config_path}")
+        log.error("❌ Configuration file not found: %s", config_path)
         sys.exit(1)
     except yaml.YAMLError as e:
-        print(f"❌ Error parsing YAML config: {e}")
+        log.error("❌ Error parsing YAML config: %s", e)
         sys.exit(1)
 
+# Matches attribute values that contain nothing needing escaping, which covers
+# the role, entity, page and microflow names making up most rule attributes
+SAFE_ATTRIBUTE = re.compile(r'[^&<>"\n\r\t]*').fullmatch
+
+def escape(value):
+    """Escape &, < and > for use in XML character data"""
+    return value.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+
+def escape_attribute(value):
+    """Escape a value for use inside a double-quoted XML attribute"""
+    value = str(value)
+    if SAFE_ATTRIBUTE(value):
+        return value
+    return (escape(value).replace('"', '&quot;').replace('\n', '&#10;')
+            .replace('\r', '&#13;').replace('\t', '&#09;'))
+
+def rule_section(tag, rules):
+    """Wrap rule fragments in their section element, self-closing when empty"""
+    if not rules:
+        return [f'    <{tag} />\n']
+    return [f'    <{tag}>\n', *rules, f'    </{tag}>\n']
+
 def generate_module_role_xml(role_name, description, entity_access, page_access, microflow_access):
-    """Generate XML for a module role compatible with Mendix 10.18.1"""
+    """Generate XML for a module role compatible with Mendix 10.18.1, as a list of fragments"""
+    fragments = [MODULE_ROLE_TEMPLATE.format(name=escape_attribute(role_name), description=escape(description))]
     
     # Generate entity access rules
-    entity_rules_xml = ""
+    entity_rules = []
     for entity, access in entity_access.items():
-        if isinstance(access, dict):
+        if type(access) is dict:
             access_type = access.get('access', 'R')
             xpath = access.get('xpath', '')
-            xpath_xml = f'<xPathConstraint>{xpath}</xPathConstraint>' if xpath else ''
         else:
             access_type = access
-            xpath_xml = ''
+            xpath = ''
         
-        entity_rules_xml += f"""
-        <entityAccess entity="{entity}" access="{access_type}">
-            {xpath_xml}
-        </entityAccess>"""
+        if xpath:
+            entity_rules.append(ENTITY_XPATH_TEMPLATE.format(
+                name=escape_attribute(entity), access=escape_attribute(access_type), xpath=escape(xpath)
+            ))
+        else:
+            entity_rules.append(ENTITY_TEMPLATE.format(name=escape_attribute(entity), access=escape_attribute(access_type)))
+    fragments += rule_section("entityAccessRules", entity_rules)
     
     # Generate page access rules
-    page_rules_xml = ""
-    for page in page_access:
-        page_rules_xml += f"""
-        <pageAccess page="{page}" access="Full"/>"""
+    fragments += rule_section("pageAccessRules",
+                              [PAGE_TEMPLATE.format(name=escape_attribute(page)) for page in page_access])
     
     # Generate microflow access rules
-    microflow_rules_xml = ""
-    for microflow in microflow_access:
-        microflow_rules_xml += f"""
-        <microflowAccess microflow="{microflow}" access="Full"/>"""
+    fragments += rule_section("microflowAccessRules",
+                              [MICROFLOW_TEMPLATE.format(name=escape_attribute(microflow)) for microflow in microflow_access])
     
-    xml_content = f"""<?xml version="1.0" encoding="UTF-8"?>
-<moduleRole xmlns="http://www.mendix.com/metamodel/Projects/7.0.0" 
-            xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" 
-            name="{role_name}">
-    <documentation>{description} - Compatible with Mendix 10.18.1</documentation>
-    <entityAccessRules>{entity_rules_xml}
-    </entityAccessRules>
-    <pageAccessRules>{page_rules_xml}
-    </pageAccessRules>
-    <microflowAccessRules>{microflow_rules_xml}
-    </microflowAccessRules>
-</moduleRole>"""
+    fragments.append('</moduleRole>')
+    return fragments
+
+def render_role(role, security_dir):
+    """Generate and save a single security role, returning (role_name, error)"""
+    try:
+        role_xml = generate_module_role_xml(*role)
+        
+        role_file = security_dir / f"{role.name}.xml"
+        with open(role_file, 'w', encoding='utf-8') as f:
+            f.write(MENDIX_XML_HEADER)
+            f.writelines(role_xml)
+        return role.name, None
+        
+    except Exception as e:
+        return role.name, str(e)
+
+def create_security_summary(security_roles):
+    """Yield the plain-text summary of the generated security roles line by line"""
+    yield "LAB Product Validation Workflow - Security Summary\n"
+    yield "=" * 60 + "\n\n"
+    yield f"Generated on: {datetime.now():%Y-%m-%d %H:%M:%S}\n"
+    yield "Compatible with: Mendix 10.18.1 + Workflow Commons 3.12.1\n\n"
     
-    return xml_content
+    yield "Security Roles Overview:\n"
+    yield "-" * 30 + "\n"
+    for role in security_roles:
+        yield f"• {role.name}\n"
+        yield f"  Description: {role.description}\n"
+        yield f"  Entity Access: {len(role.entity_access)} entities\n"
+        yield f"  Page Access: {len(role.page_access)} pages\n"
+        yield f"  Microflow Access: {len(role.microflow_access)} microflows\n\n"
+    
+    yield ("XPath Constraints Applied:\n"
+           + "-" * 30 + "\n"
+           "• LABTechnician: Data filtered by current user ownership\n"
+           "• LABViewer: Only completed workflows visible\n"
+           "• LABAdmin: Full access to all data\n\n")
+    
+    yield ("Compatibility Notes:\n"
+           + "-" * 20 + "\n"
+           "• Uses System.WorkflowUserTask (not WorkflowEndedUserTask)\n"
+           "• Compatible with Workflow Commons 3.12.1\n"
+           "• XPath constraints use [%CurrentUser%] syntax\n"
+           "• No View Entities used (Mendix 11+ feature)\n")
 
 def main():
     parser = argparse.ArgumentParser(description="Generate LAB Workflow Security Roles")
     parser.add_argument("--config", required=True, help="Path to configuration file")
     parser.add_argument("--output", default="output", help="Output directory")
+    parser.add_argument("--quiet", action="store_true", help="Only log warnings and errors")
     
     args = parser.parse_args()
     
+    logging.basicConfig(level=logging.WARNING if args.quiet else logging.INFO,
+                        format="%(message)s", stream=sys.stdout)
+    
     # Create output directory
     output_dir = Path(args.output)
     security_dir = output_dir / "security"
     security_dir.mkdir(parents=True, exist_ok=True)
     
-    print("🔒 Generating LAB Workflow Security Roles...")
-    print(f"📁 Output directory: {security_dir}")
+    log.info("🔒 Generating LAB Workflow Security Roles...")
+    log.info("📁 Output directory: %s", security_dir)
     
-    # Define security roles compatible with Mendix 10.18.1
-    security_roles = [
-        {
-            "name": "LABAdmin",
-            "description": "Full system administration and workflow management capabilities",
-            "entity_access": {
-                "ProductValidation": "CRUD",
-                "ImageAcquisition": "CRUD", 
-                "ImageQualityValidation": "CRUD",
-                "DetailedImageAcquisition": "CRUD",
-                "ImageAnalysis": "CRUD",
-                "KPIExtraction": "CRUD",
-                "ValidationResult": "CRUD",
-                "ValidationReport": "CRUD",
-                "WorkflowAuditTrail": "CRUD",
-                "System.WorkflowUserTask": "CRUD",
-                "System.Workflow": "CRUD",
-                "Administration.Account": "R"
-            },
-            "page_access": [
-                "WorkflowAdminCenter",
-                "WorkflowAdminDashboard", 
-                "TaskAssignment_Management",
-                "UserManagement_Workflow",
-                "SystemConfiguration",
-                "AuditTrailViewer",
-                "TaskInbox",
-                "ValidationResultPage",
-                "ReportGenerationPage"
-            ],
-            "microflow_access": [
-                "ACT_CreateTask",
-                "ACT_AssignTask", 
-                "ACT_CompleteTask",
-                "SUB_CheckUserPermissions",
-                "ACT_ProcessImageQuality",
-                "DS_GetMyTasks",
-                "ACT_InitiateWorkflow",
-                "ACT_GenerateValidationReport",
-                "ACT_UpdateAuditTrail",
-                "ACT_ValidateWorkflowOutcome",
-                "SUB_NotifyStakeholders",
-                "DS_GetWorkflowHistory",
-                "ACT_HandleWorkflowException",
-                "SUB_CalculateQualityMetrics",
-                "ACT_ArchiveCompletedWorkflow"
-            ]
-        },
-        {
-            "name": "LABTechnician", 
-            "description": "Task execution and data entry for assigned laboratory workflows",
-            "entity_access": {
-                "ProductValidation": "R",
-                "ImageAcquisition": {
-                    "access": "CRUD",
-                    "xpath": "[TechnicianID = '[%CurrentUser%]']"
-                },
-                "ImageQualityValidation": {
-                    "access": "CRUD", 
-                    "xpath": "[ValidatedBy = '[%CurrentUser%]']"
-                },
-                "DetailedImageAcquisition": {
-                    "access": "CRUD",
-                    "xpath": "[TechnicianID = '[%CurrentUser%]']"
-                },
-                "ImageAnalysis": {
-                    "access": "CRUD",
-                    "xpath": "[ProcessedBy = '[%CurrentUser%]']"
-                },
-                "KPIExtraction": {
-                    "access": "CRUD",
-                    "xpath": "[ExtractedBy = '[%CurrentUser%]']"
-                },
-                "ValidationResult": "R",
-                "ValidationReport": "R",
-                "WorkflowAuditTrail": {
-                    "access": "R",
-                    "xpath": "[PerformedBy = '[%CurrentUser%]']"
-                },
-                "System.WorkflowUserTask": {
-                    "access": "RU",
-                    "xpath": "[System.WorkflowUserTask_Account = '[%CurrentUser%]']"
-                },
-                "System.Workflow": "R",
-                "Administration.Account": "R"
-            },
-            "page_access": [
-                "TaskInbox",
-                "TaskDashboard", 
-                "ImageAcquisitionTask",
-                "ImageQualityValidationTask",
-                "DetailedImageAcquisitionTask",
-                "ImageAnalysisTask",
-                "KPIExtractionTask",
-                "ReportGenerationPage"
-            ],
-            "microflow_access": [
-                "ACT_CompleteTask",
-                "SUB_CheckUserPermissions",
-                "ACT_ProcessImageQuality",
-                "DS_GetMyTasks",
-                "ACT_InitiateWorkflow",
-                "ACT_GenerateValidationReport",
-                "ACT_UpdateAuditTrail",
-                "SUB_NotifyStakeholders",
-                "SUB_CalculateQualityMetrics"
-            ]
-        },
-        {
-            "name": "LABViewer",
-            "description": "Read-only access to completed workflows and public reports",
-            "entity_access": {
-                "ProductValidation": {
-                    "access": "R",
-                    "xpath": "[Status = 'Completed']"
-                },
-                "ImageAcquisition": {
-                    "access": "R", 
-                    "xpath": "[ProductValidation/Status = 'Completed']"
-                },
-                "ImageQualityValidation": {
-                    "access": "R",
-                    "xpath": "[ImageAcquisition/ProductValidation/Status = 'Completed']"
-                },
-                "DetailedImageAcquisition": {
-                    "access": "R",
-                    "xpath": "[ProductValidation/Status = 'Completed']"
-                },
-                "ImageAnalysis": {
-                    "access": "R",
-                    "xpath": "[ProductValidation/Status = 'Completed']"
-                },
-                "KPIExtraction": {
-                    "access": "R",
-                    "xpath": "[ProductValidation/Status = 'Completed']"
-                },
-                "ValidationResult": "R",
-                "ValidationReport": "R",
-                "WorkflowAuditTrail": {
-                    "access": "R",
-                    "xpath": "[ProductValidation/Status = 'Completed']"
-                },
-                "System.WorkflowUserTask": {
-                    "access": "R",
-                    "xpath": "[System.Workflow/System.Workflow_ProductValidation/Status = 'Completed']"
-                },
-                "System.Workflow": {
-                    "access": "R",
-                    "xpath": "[System.Workflow_ProductValidation/Status = 'Completed']"
-                },
-                "Administration.Account": "R"
-            },
-            "page_access": [
-                "PublicReportViewer",
-                "WorkflowStatusViewer", 
-                "ValidationResultViewer",
-                "CompletedWorkflowsOverview"
-            ],
-            "microflow_access": [
-                "SUB_CheckUserPermissions",
-                "DS_GetWorkflowHistory"
-            ]
-        }
-    ]
+    # Generate security role XML files; each role takes microseconds, so they
+    # are rendered serially rather than paying for worker startup
+    results = [render_role(role, security_dir) for role in SECURITY_ROLES]
     
-    # Generate security role XML files
-    for role in security_roles:
-        xml_content = generate_module_role_xml(
-            role["name"],
-            role["description"],
-            role["entity_access"],
-            role["page_access"], 
-            role["microflow_access"]
-        )
-        
-        role_file = security_dir / f"{role['name']}.xml"
-        with open(role_file, 'w', encoding='utf-8') as f:
-            f.write(xml_content)
-        
-        print(f"✅ Generated security role: {role['name']}.xml")
+    role_status = {}
+    for role_name, error in results:
+        role_status[role_name] = error is None
+        if error is None:
+            log.info("✅ Generated security role: %s.xml", role_name)
+        else:
+            log.error("❌ Error generating security role %s: %s", role_name, error)
     
-    print(f"\n🎉 Security roles generation completed!")
-    print(f"🔒 Generated {len(security_roles)} security roles")
-    print(f"📁 Files saved to: {security_dir}")
+    log.info("\n🎉 Security roles generation completed!")
+    log.info("🔒 Generated %d security roles", sum(role_status.values()))
+    log.info("📁 Files saved to: %s", security_dir)
     
     # Generate security summary
     summary_file = security_dir / "SECURITY_SUMMARY.txt"
-    with open(summary_file, 'w', encoding='utf-8') as f:
-        f.write("LAB Product Validation Workflow - Security Summary\n")
-        f.write("=" * 60 + "\n\n")
-        f.write(f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-        f.write(f"Compatible with: Mendix 10.18.1 + Workflow Commons 3.12.1\n\n")
-        
-        f.write("Security Roles Overview:\n")
-        f.write("-" * 30 + "\n")
-        for role in security_roles:
-            f.write(f"• {role['name']}\n")
-            f.write(f"  Description: {role['description']}\n")
-            f.write(f"  Entity Access: {len(role['entity_access'])} entities\n")
-            f.write(f"  Page Access: {len(role['page_access'])} pages\n")
-            f.write(f"  Microflow Access: {len(role['microflow_access'])} microflows\n\n")
-        
-        f.write("XPath Constraints Applied:\n")
-        f.write("-" * 30 + "\n")
-        f.write("• LABTechnician: Data filtered by current user ownership\n")
-        f.write("• LABViewer: Only completed workflows visible\n")
-        f.write("• LABAdmin: Full access to all data\n\n")
-        
-        f.write("Compatibility Notes:\n")
-        f.write("-" * 20 + "\n")
-        f.write("• Uses System.WorkflowUserTask (not WorkflowEndedUserTask)\n")
-        f.write("• Compatible with Workflow Commons 3.12.1\n")
-        f.write("• XPath constraints use [%CurrentUser%] syntax\n")
-        f.write("• No View Entities used (Mendix 11+ feature)\n")
+    with open(summary_file, 'w', encoding='utf-8', buffering=64 * 1024) as f:
+        f.writelines(create_security_summary(SECURITY_ROLES))
     
-    print(f"📋 Generated summary: SECURITY_SUMMARY.txt")
+    log.info("📋 Generated summary: SECURITY_SUMMARY.txt")
     
-    return True
+    return all(role_status.values())
 
 if __name__ == "__main__":
     try:
         success = main()
         sys.exit(0 if success else 1)
     except Exception as e:
-        print(f"❌ Fatal error: {e}")
+        log.error("❌ Fatal error: %s", e)
         sys.exit(1)
\ No newline at end of file
@@ -4,243 +4,50 @@ LAB Product Validation Workflow - Workflow Definition Generator
 Generates complete workflow definitions with TRUE/FALSE decision logic
 """
 
+import os
+import re
 import yaml
-import xml.etree.ElementTree as ET
+import functools
+import logging
 from pathlib import Path
 import argparse
 import sys
+import traceback
 from datetime import datetime
+from itertools import repeat
+from collections.abc import Mapping
+from types import MappingProxyType
 
-def load_config(config_path):
-    """Load configuration from YAML file with fallback"""
-    try:
-        # Try the specified path first
-        if Path(config_path).exists():
-            with open(config_path, 'r', encoding='utf-8') as file:
-                return yaml.safe_load(file)
-        
-        # Try alternative paths
-        alternative_paths = [
-            Path("config/lab-workflow-config.yaml"),
-            Path("config/workflow-config.yaml"),
-            Path("../config/lab-workflow-config.yaml")
-        ]
-        
-        for alt_path in alternative_paths:
-            if alt_path.exists():
-                print(f"📁 Using configuration from: {alt_path}")
-                with open(alt_path, 'r', encoding='utf-8') as file:
-                    return yaml.safe_load(file)
-        
-        # If no config found, provide default workflow configuration
-        print("⚠️ No configuration file found, using default workflow")
-        return get_default_workflow_config()
-        
-    except Exception as e:
-        print(f"❌ Error loading configuration: {e}")
-        return None
+log = logging.getLogger("workflowgen")
 
-def get_default_workflow_config():
-    """Return default workflow configuration"""
-    return {
-        'workflows': [
-            {
-                'name': 'LAB_ProductValidation',
-                'description': 'Main LAB product validation workflow with TRUE/FALSE decision logic',
-                'context_entity': 'ProductValidation',
-                'steps': [
-                    {
-                        'id': 'start',
-                        'name': 'Start',
-                        'type': 'start_event',
-                        'description': 'Workflow initiation'
-                    },
-                    {
-                        'id': 'image_acquisition',
-                        'name': 'Image Acquisition',
-                        'type': 'user_task',
-                        'description': 'Capture product validation images',
-                        'page': 'ImageAcquisitionTask',
-                        'assignee_expression': '$WorkflowContext/InitiatedBy',
-                        'outcomes': ['completed', 'cancelled']
-                    },
-                    {
-                        'id': 'quality_validation',
-                        'name': 'Quality Validation',
-                        'type': 'decision',
-                        'description': 'CRITICAL: TRUE/FALSE decision point for image quality',
-                        'condition': '$WorkflowContext/LAB_ProductValidation/ImageAcquisition/IsQualityApproved',
-                        'outcomes': ['true', 'false']
-                    },
-                    {
-                        'id': 'detailed_acquisition',
-                        'name': 'Detailed Image Acquisition',
-                        'type': 'user_task',
-                        'description': 'Enhanced image processing (TRUE path only)',
-                        'page': 'DetailedImageAcquisitionTask',
-                        'assignee_expression': '$WorkflowContext/InitiatedBy',
-                        'condition': 'quality_validation == true',
-                        'outcomes': ['completed']
-                    },
-                    {
-                        'id': 'image_analysis',
-                        'name': 'Automated Analysis',
-                        'type': 'service_task',
-                        'description': 'Automated image analysis and KPI extraction',
-                        'microflow': 'ACT_ProcessImageAnalysis',
-                        'condition': 'quality_validation == true',
-                        'outcomes': ['completed']
-                    },
-                    {
-                        'id': 'kpi_extraction',
-                        'name': 'KPI Extraction',
-                        'type': 'service_task',
-                        'description': 'Extract performance indicators',
-                        'microflow': 'ACT_ExtractKPIs',
-                        'condition': 'quality_validation == true',
-                        'outcomes': ['completed']
-                    },
-                    {
-                        'id': 'lab_validation',
-                        'name': 'LAB Validation',
-                        'type': 'user_task',
-                        'description': 'Final validation decision by LAB administrator',
-                        'page': 'ValidationResultPage',
-                        'assignee_role': 'LABAdmin',
-                        'condition': 'quality_validation == true',
-                        'outcomes': ['approved', 'rejected', 'requires_rework']
-                    },
-                    {
-                        'id': 'report_generation',
-                        'name': 'Report Generation',
-                        'type': 'service_task',
-                        'description': 'Generate comprehensive validation report',
-                        'microflow': 'ACT_GenerateValidationReport',
-                        'condition': 'quality_validation == true AND lab_validation == approved',
-                        'outcomes': ['completed']
-                    },
-                    {
-                        'id': 'workflow_approved',
-                        'name': 'Workflow Approved',
-                        'type': 'end_event',
-                        'description': 'Successful completion - TRUE outcome',
-                        'condition': 'quality_validation == true AND lab_validation == approved',
-                        'result': 'true'
-                    },
-                    {
-                        'id': 'workflow_rejected',
-                        'name': 'Workflow Rejected',
-                        'type': 'end_event',
-                        'description': 'Validation failed - FALSE outcome',
-                        'condition': 'quality_validation == false OR lab_validation == rejected',
-                        'result': 'false'
-                    }
-                ],
-                'flows': [
-                    {'from': 'start', 'to': 'image_acquisition'},
-                    {'from': 'image_acquisition', 'to': 'quality_validation', 'condition': 'completed'},
-                    {'from': 'quality_validation', 'to': 'detailed_acquisition', 'condition': 'true'},
-                    {'from': 'quality_validation', 'to': 'workflow_rejected', 'condition': 'false'},
-                    {'from': 'detailed_acquisition', 'to': 'image_analysis', 'condition': 'completed'},
-                    {'from': 'image_analysis', 'to': 'kpi_extraction', 'condition': 'completed'},
-                    {'from': 'kpi_extraction', 'to': 'lab_validation', 'condition': 'completed'},
-                    {'from': 'lab_validation', 'to': 'report_generation', 'condition': 'approved'},
-                    {'from': 'lab_validation', 'to': 'workflow_rejected', 'condition': 'rejected'},
-                    {'from': 'report_generation', 'to': 'workflow_approved', 'condition': 'completed'}
-                ]
-            }
-        ]
-    }
+# Use the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as YAML_LOADER
+except ImportError:
+    from yaml import SafeLoader as YAML_LOADER
 
-def generate_workflow_xml(workflow_config):
-    """Generate XML for a single workflow definition"""
+def ruamel_yaml():
+    """Import ruamel.yaml's YAML class on demand, or return None if it is not installed"""
+    # Only --fast-yaml needs it, so the default path never pays for the import
     try:
-        # Create root workflow element
-        workflow = ET.Element("workflow")
-        workflow.set("name", workflow_config.get('name', 'UnknownWorkflow'))
-        
-        # Add documentation
-        if 'description' in workflow_config:
-            documentation = ET.SubElement(workflow, "documentation")
-            documentation.text = workflow_config['description']
-        
-        # Add context entity
-        if 'context_entity' in workflow_config:
-            context = ET.SubElement(workflow, "contextEntity")
-            context.set("name", workflow_config['context_entity'])
-        
-        # Add workflow steps
-        if 'steps' in workflow_config and workflow_config['steps']:
-            steps_elem = ET.SubElement(workflow, "steps")
-            
-            for step in workflow_config['steps']:
-                step_elem = ET.SubElement(steps_elem, "step")
-                step_elem.set("id", step.get('id', 'unknown'))
-                step_elem.set("name", step.get('name', 'Unknown Step'))
-                step_elem.set("type", step.get('type', 'task'))
-                
-                # Add step documentation
-                if 'description' in step:
-                    step_doc = ET.SubElement(step_elem, "documentation")
-                    step_doc.text = step['description']
-                
-                # Add step-specific properties
-                if 'page' in step:
-                    step_elem.set("page", step['page'])
-                if 'microflow' in step:
-                    step_elem.set("microflow", step['microflow'])
-                if 'assignee_expression' in step:
-                    assignee = ET.SubElement(step_elem, "assignee")
-                    assignee.text = step['assignee_expression']
-                if 'assignee_role' in step:
-                    role = ET.SubElement(step_elem, "assigneeRole")
-                    role.text = step['assignee_role']
-                if 'condition' in step:
-                    condition = ET.SubElement(step_elem, "condition")
-                    condition.text = step['condition']
-                if 'result' in step:
-                    step_elem.set("result", step['result'])
-                
-                # Add outcomes
-                if 'outcomes' in step:
-                    outcomes = ET.SubElement(step_elem, "outcomes")
-                    for outcome in step['outcomes']:
-                        outcome_elem = ET.SubElement(outcomes, "outcome")
-                        outcome_elem.set("name", outcome)
-        
-        # Add workflow flows (connections between steps)
-        if 'flows' in workflow_config and workflow_config['flows']:
-            flows_elem = ET.SubElement(workflow, "flows")
-            
-            for flow in workflow_config['flows']:
-                flow_elem = ET.SubElement(flows_elem, "flow")
-                flow_elem.set("from", flow.get('from', ''))
-                flow_elem.set("to", flow.get('to', ''))
-                
-                if 'condition' in flow:
-                    condition = ET.SubElement(flow_elem, "condition")
-                    condition.text = flow['condition']
-        
-        return workflow
-        
-    except Exception as e:
-        print(f"❌ Error creating workflow XML for {workflow_config.get('name', 'unknown')}: {e}")
+        from ruamel.yaml import YAML
+    except ImportError:
         return None
+    return YAML
 
-def create_mendix_xml_header():
-    """Create proper Mendix XML header"""
-    return '<?xml version="1.0" encoding="UTF-8"?>\n'
+# Workflows are rendered in a process pool only from this many workflows
+# upwards; below that, pool startup costs more than the rendering itself
+PARALLEL_MIN_WORKFLOWS = 500
 
-def format_xml_output(element):
-    """Format XML with proper indentation"""
-    from xml.dom import minidom
-    rough_string = ET.tostring(element, encoding='unicode')
-    reparsed = minidom.parseString(rough_string)
-    return reparsed.toprettyxml(indent="  ").split('\n', 1)[1]  # Remove first line
+# Fallback configuration locations tried after the --config path
+ALT_CONFIG_PATHS = (
+    "config/lab-workflow-config.yaml",
+    "config/workflow-config.yaml",
+    "../config/lab-workflow-config.yaml"
+)
 
-def create_workflow_diagram(workflow_config, output_path):
-    """Create a visual diagram of the workflow in Mermaid format"""
-    diagram = """# LAB Product Validation Workflow Diagram
+# Mermaid diagram of the workflow, written once per run
+WORKFLOW_DIAGRAM_MD = """# LAB Product Validation Workflow Diagram
 
 ```mermaid
 flowchart TD
@@ -306,13 +113,340 @@ The workflow implements a **TRUE/FALSE decision logic** at the Quality Validatio
 - **System**: Automated Analysis, KPI Extraction, Report Generation
 
 """
+
+class Step:
+    """A single workflow step; unset or null optional properties are None"""
+    __slots__ = ('id', 'name', 'type', 'description', 'page', 'microflow',
+                 'assignee_expression', 'assignee_role', 'condition', 'result', 'outcomes')
     
+    def __init__(self, id=None, name=None, type=None, description=None, page=None,
+                 microflow=None, assignee_expression=None, assignee_role=None,
+                 condition=None, result=None, outcomes=None):
+        # An explicit YAML null falls back to the same default as an absent key
+        self.id = 'unknown' if id is None else id
+        self.name = 'Unknown Step' if name is None else name
+        self.type = 'task' if type is None else type
+        self.description = description
+        self.page = page
+        self.microflow = microflow
+        self.assignee_expression = assignee_expression
+        self.assignee_role = assignee_role
+        self.condition = condition
+        self.result = result
+        self.outcomes = outcomes
+
+STEP_FIELDS = frozenset(Step.__slots__)
+
+def load_steps(steps):
+    """Convert a workflow's step dicts into Step objects, ignoring unknown keys"""
+    return [Step(**{key: value for key, value in step.items() if key in STEP_FIELDS})
+            for step in steps]
+
+@functools.lru_cache(maxsize=8)
+def parse_config_file(path, mtime_ns, size, fast_yaml=False):
+    """Parse a YAML file once per (path, mtime, size) and return a read-only view"""
+    with open(path, 'rb') as file:
+        ruamel_class = ruamel_yaml() if fast_yaml else None
+        if ruamel_class is not None:
+            config = ruamel_class(typ='safe', pure=False).load(file)
+        else:
+            config = yaml.load(file, Loader=YAML_LOADER)
+    return MappingProxyType(config) if isinstance(config, dict) else config
+
+def read_config(config_path, fast_yaml=False):
+    """Return the parsed configuration, reusing the cached parse while the file is unchanged"""
+    stat = os.stat(config_path)
+    return parse_config_file(os.path.abspath(config_path), stat.st_mtime_ns, stat.st_size, fast_yaml)
+
+def load_config(config_path, fast_yaml=False):
+    """Load configuration from YAML file with fallback"""
+    try:
+        # Try the specified path first, then the alternatives; a missing file
+        # surfaces as FileNotFoundError from the stat in read_config
+        for candidate in (config_path, *ALT_CONFIG_PATHS):
+            try:
+                config = read_config(candidate, fast_yaml)
+            except FileNotFoundError:
+                continue
+            if candidate != config_path:
+                log.info("📁 Using configuration from: %s", candidate)
+            return config
+        
+        # If no config found, provide default workflow configuration
+        log.warning("⚠️ No configuration file found, using default workflow")
+        return get_default_workflow_config()
+        
+    except Exception as e:
+        log.error("❌ Error loading configuration: %s", e)
+        return None
+
+# Default workflow used when no configuration file is found. It is returned
+# as-is by get_default_workflow_config, so main must not modify it
+DEFAULT_WORKFLOW_CONFIG = {
+    'workflows': [
+        {
+            'name': 'LAB_ProductValidation',
+            'description': 'Main LAB product validation workflow with TRUE/FALSE decision logic',
+            'context_entity': 'ProductValidation',
+            'steps': [
+                {
+                    'id': 'start',
+                    'name': 'Start',
+                    'type': 'start_event',
+                    'description': 'Workflow initiation'
+                },
+                {
+                    'id': 'image_acquisition',
+                    'name': 'Image Acquisition',
+                    'type': 'user_task',
+                    'description': 'Capture product validation images',
+                    'page': 'ImageAcquisitionTask',
+                    'assignee_expression': '$WorkflowContext/InitiatedBy',
+                    'outcomes': ['completed', 'cancelled']
+                },
+                {
+                    'id': 'quality_validation',
+                    'name': 'Quality Validation',
+                    'type': 'decision',
+                    'description': 'CRITICAL: TRUE/FALSE decision point for image quality',
+                    'condition': '$WorkflowContext/LAB_ProductValidation/ImageAcquisition/IsQualityApproved',
+                    'outcomes': ['true', 'false']
+                },
+                {
+                    'id': 'detailed_acquisition',
+                    'name': 'Detailed Image Acquisition',
+                    'type': 'user_task',
+                    'description': 'Enhanced image processing (TRUE path only)',
+                    'page': 'DetailedImageAcquisitionTask',
+                    'assignee_expression': '$WorkflowContext/InitiatedBy',
+                    'condition': 'quality_validation == true',
+                    'outcomes': ['completed']
+                },
+                {
+                    'id': 'image_analysis',
+                    'name': 'Automated Analysis',
+                    'type': 'service_task',
+                    'description': 'Automated image analysis and KPI extraction',
+                    'microflow': 'ACT_ProcessImageAnalysis',
+                    'condition': 'quality_validation == true',
+                    'outcomes': ['completed']
+                },
+                {
+                    'id': 'kpi_extraction',
+                    'name': 'KPI Extraction',
+                    'type': 'service_task',
+                    'description': 'Extract performance indicators',
+                    'microflow': 'ACT_ExtractKPIs',
+                    'condition': 'quality_validation == true',
+                    'outcomes': ['completed']
+                },
+                {
+                    'id': 'lab_validation',
+                    'name': 'LAB Validation',
+                    'type': 'user_task',
+                    'description': 'Final validation decision by LAB administrator',
+                    'page': 'ValidationResultPage',
+                    'assignee_role': 'LABAdmin',
+                    'condition': 'quality_validation == true',
+                    'outcomes': ['approved', 'rejected', 'requires_rework']
+                },
+                {
+                    'id': 'report_generation',
+                    'name': 'Report Generation',
+                    'type': 'service_task',
+                    'description': 'Generate comprehensive validation report',
+                    'microflow': 'ACT_GenerateValidationReport',
+                    'condition': 'quality_validation == true AND lab_validation == approved',
+                    'outcomes': ['completed']
+                },
+                {
+                    'id': 'workflow_approved',
+                    'name': 'Workflow Approved',
+                    'type': 'end_event',
+                    'description': 'Successful completion - TRUE outcome',
+                    'condition': 'quality_validation == true AND lab_validation == approved',
+                    'result': 'true'
+                },
+                {
+                    'id': 'workflow_rejected',
+                    'name': 'Workflow Rejected',
+                    'type': 'end_event',
+                    'description': 'Validation failed - FALSE outcome',
+                    'condition': 'quality_validation == false OR lab_validation == rejected',
+                    'result': 'false'
+                }
+            ],
+            'flows': [
+                {'from': 'start', 'to': 'image_acquisition'},
+                {'from': 'image_acquisition', 'to': 'quality_validation', 'condition': 'completed'},
+                {'from': 'quality_validation', 'to': 'detailed_acquisition', 'condition': 'true'},
+                {'from': 'quality_validation', 'to': 'workflow_rejected', 'condition': 'false'},
+                {'from': 'detailed_acquisition', 'to': 'image_analysis', 'condition': 'completed'},
+                {'from': 'image_analysis', 'to': 'kpi_extraction', 'condition': 'completed'},
+                {'from': 'kpi_extraction', 'to': 'lab_validation', 'condition': 'completed'},
+                {'from': 'lab_validation', 'to': 'report_generation', 'condition': 'approved'},
+                {'from': 'lab_validation', 'to': 'workflow_rejected', 'condition': 'rejected'},
+                {'from': 'report_generation', 'to': 'workflow_approved', 'condition': 'completed'}
+            ]
+        }
+    ]
+}
+
+def get_default_workflow_config():
+    """Return default workflow configuration"""
+    return DEFAULT_WORKFLOW_CONFIG
+
+# Fixed top matter of a workflow document, formatted with escaped values
+MENDIX_XML_HEADER = '<?xml version="1.0" encoding="UTF-8"?>\n'
+WORKFLOW_OPEN_TEMPLATE = '<workflow name="{name}">\n'
+WORKFLOW_EMPTY_TEMPLATE = '<workflow name="{name}" />\n'
+CONTEXT_ENTITY_TEMPLATE = '  <contextEntity name="{name}" />\n'
+WORKFLOW_CLOSE = '</workflow>\n'
+
+# Matches attribute values that contain nothing needing escaping, which covers
+# the identifiers (step ids, pages, microflows) making up most attributes
+SAFE_ATTRIBUTE = re.compile(r'[^&<>"\n\r\t]*').fullmatch
+
+def escape(value):
+    """Escape &, < and > for use in XML character data"""
+    return value.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+
+def escape_attribute(value):
+    """Escape a value for use inside a double-quoted XML attribute"""
+    value = str(value)
+    if SAFE_ATTRIBUTE(value):
+        return value
+    return (escape(value).replace('"', '&quot;').replace('\n', '&#10;')
+            .replace('\r', '&#13;').replace('\t', '&#09;'))
+
+def text_element(indent, tag, text):
+    """Render a single text-only element on its own line"""
+    if not text:
+        return f'{indent}<{tag} />\n'
+    return f'{indent}<{tag}>{escape(str(text))}</{tag}>\n'
+
+def generate_workflow_xml(workflow_config):
+    """Generate XML for a single workflow definition as a list of lines"""
+    try:
+        name = escape_attribute(workflow_config.get('name', 'UnknownWorkflow'))
+        
+        # A stub workflow without any content collapses to a self-closing element
+        if ('description' not in workflow_config and 'context_entity' not in workflow_config
+                and not workflow_config.get('steps') and not workflow_config.get('flows')):
+            return [WORKFLOW_EMPTY_TEMPLATE.format(name=name)]
+        
+        # Open root workflow element
+        lines = [WORKFLOW_OPEN_TEMPLATE.format(name=name)]
+        
+        # Add documentation
+        if 'description' in workflow_config:
+            lines.append(text_element('  ', 'documentation', workflow_config['description']))
+        
+        # Add context entity
+        if 'context_entity' in workflow_config:
+            lines.append(CONTEXT_ENTITY_TEMPLATE.format(name=escape_attribute(workflow_config['context_entity'])))
+        
+        # Add workflow steps
+        if 'steps' in workflow_config and workflow_config['steps']:
+            lines.append('  <steps>\n')
+            
+            # Converted per workflow so a malformed step only fails this workflow
+            for step in load_steps(workflow_config['steps']):
+                attributes = [
+                    f'id="{escape_attribute(step.id)}"',
+                    f'name="{escape_attribute(step.name)}"',
+                    f'type="{escape_attribute(step.type)}"'
+                ]
+                
+                # Add step-specific properties
+                if step.page is not None:
+                    attributes.append(f'page="{escape_attribute(step.page)}"')
+                if step.microflow is not None:
+                    attributes.append(f'microflow="{escape_attribute(step.microflow)}"')
+                if step.result is not None:
+                    attributes.append(f'result="{escape_attribute(step.result)}"')
+                
+                children = []
+                if step.description is not None:
+                    children.append(text_element('      ', 'documentation', step.description))
+                if step.assignee_expression is not None:
+                    children.append(text_element('      ', 'assignee', step.assignee_expression))
+                if step.assignee_role is not None:
+                    children.append(text_element('      ', 'assigneeRole', step.assignee_role))
+                if step.condition is not None:
+                    children.append(text_element('      ', 'condition', step.condition))
+                
+                # Add outcomes
+                if step.outcomes is not None:
+                    if step.outcomes:
+                        children.append('      <outcomes>\n')
+                        children.extend(
+                            f'        <outcome name="{escape_attribute(outcome)}" />\n'
+                            for outcome in step.outcomes
+                        )
+                        children.append('      </outcomes>\n')
+                    else:
+                        children.append('      <outcomes />\n')
+                
+                if children:
+                    lines.append(f'    <step {" ".join(attributes)}>\n')
+                    lines.extend(children)
+                    lines.append('    </step>\n')
+                else:
+                    lines.append(f'    <step {" ".join(attributes)} />\n')
+            
+            lines.append('  </steps>\n')
+        
+        # Add workflow flows (connections between steps)
+        if 'flows' in workflow_config and workflow_config['flows']:
+            lines.append('  <flows>\n')
+            
+            for flow in workflow_config['flows']:
+                flow_open = f'    <flow from="{escape_attribute(flow.get("from", ""))}" to="{escape_attribute(flow.get("to", ""))}"'
+                if 'condition' in flow:
+                    lines.append(flow_open + '>\n')
+                    lines.append(text_element('      ', 'condition', flow['condition']))
+                    lines.append('    </flow>\n')
+                else:
+                    lines.append(flow_open + ' />\n')
+            
+            lines.append('  </flows>\n')
+        
+        lines.append(WORKFLOW_CLOSE)
+        return lines
+        
+    except Exception as e:
+        log.error("❌ Error creating workflow XML for %s: %s", workflow_config.get('name', 'unknown'), e)
+        return None
+
+def create_workflow_diagram(output_path):
+    """Write the visual Mermaid diagram of the workflow"""
     diagram_file = output_path / "WORKFLOW_DIAGRAM.md"
     with open(diagram_file, 'w', encoding='utf-8') as f:
-        f.write(diagram)
-    
+        f.write(WORKFLOW_DIAGRAM_MD)
     return diagram_file
 
+def render_workflow(workflow_config, output_path):
+    """Generate and save a single workflow, returning (workflow_name, error, traceback)"""
+    if not isinstance(workflow_config, Mapping):
+        return 'Unknown', f"Workflow entry is not a mapping: {workflow_config!r}", None
+    workflow_name = workflow_config.get('name', 'Unknown')
+    try:
+        # Create workflow XML
+        workflow_xml = generate_workflow_xml(workflow_config)
+        if workflow_xml is None:
+            return workflow_name, f"Failed to generate XML for {workflow_name}", None
+        
+        # Save to file with proper formatting; header and body are joined and
+        # written with one call, in text mode so line endings follow the platform
+        workflow_file = output_path / f"{workflow_name}.xml"
+        with open(workflow_file, 'w', encoding='utf-8') as f:
+            f.write(''.join((MENDIX_XML_HEADER, *workflow_xml)))
+        return workflow_name, None, None
+        
+    except Exception as e:
+        return workflow_name, f"Error generating {workflow_name}: {e}", traceback.format_exc()
+
 def main():
     """Main function to generate workflows"""
     parser = argparse.ArgumentParser(description='Generate LAB Workflow Definitions')
@@ -322,73 +456,75 @@ def main():
                        help='Output directory for generated files')
     parser.add_argument('--debug', action='store_true', 
                        help='Enable debug output')
+    parser.add_argument('--fast-yaml', action='store_true', 
+                       help='Parse the configuration with ruamel.yaml\'s C loader if installed')
     
     args = parser.parse_args()
     
-    print("🔄 Generating LAB Workflow Definitions...")
-    print(f"📋 Configuration: {args.config}")
-    print(f"📁 Output: {args.output}")
+    logging.basicConfig(level=logging.DEBUG if args.debug else logging.INFO,
+                        format="%(message)s", stream=sys.stdout)
+    
+    log.info("🔄 Generating LAB Workflow Definitions...")
+    log.info("📋 Configuration: %s", args.config)
+    log.info("📁 Output: %s", args.output)
     
-    if args.debug:
-        print(f"🐛 Debug mode enabled")
-        print(f"🐛 Python path: {sys.executable}")
-        print(f"🐛 Working directory: {Path.cwd()}")
+    log.debug("🐛 Debug mode enabled")
+    log.debug("🐛 Python path: %s", sys.executable)
+    log.debug("🐛 Working directory: %s", Path.cwd())
     
     # Create output directory
     output_path = Path(args.output)
     output_path.mkdir(parents=True, exist_ok=True)
-    print(f"📁 Created output directory: {output_path.absolute()}")
+    absolute_output = output_path.absolute()
+    log.info("📁 Created output directory: %s", absolute_output)
     
     # Load configuration
-    config = load_config(args.config)
+    if args.fast_yaml and ruamel_yaml() is None:
+        log.warning("⚠️ ruamel.yaml is not installed, parsing with PyYAML")
+    config = load_config(args.config, args.fast_yaml)
     if config is None:
-        print("❌ Failed to load configuration")
+        log.error("❌ Failed to load configuration")
         return 1
     
-    if args.debug:
-        print(f"🐛 Loaded configuration keys: {list(config.keys())}")
+    # A YAML file whose top level is not a mapping has no workflows section
+    is_mapping = isinstance(config, Mapping)
+    if is_mapping and log.isEnabledFor(logging.DEBUG):
+        log.debug("🐛 Loaded configuration keys: %s", list(config.keys()))
     
     # Generate workflows
-    if 'workflows' in config and config['workflows']:
-        print(f"🔄 Found {len(config['workflows'])} workflows to generate")
+    workflows = config.get('workflows') if is_mapping else None
+    if workflows:
+        log.info("🔄 Found %d workflows to generate", len(workflows))
+        
+        if len(workflows) >= PARALLEL_MIN_WORKFLOWS:
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor() as executor:
+                results = list(executor.map(render_workflow, workflows, repeat(output_path), chunksize=4))
+        else:
+            results = [render_workflow(workflow_config, output_path) for workflow_config in workflows]
         
         generated_count = 0
-        for workflow_config in config['workflows']:
-            try:
-                workflow_name = workflow_config.get('name', 'Unknown')
-                print(f"🔨 Generating: {workflow_name}")
-                
-                # Create workflow XML
-                workflow_xml = generate_workflow_xml(workflow_config)
-                if workflow_xml is not None:
-                    # Save to file with proper formatting
-                    workflow_file = output_path / f"{workflow_name}.xml"
-                    
-                    with open(workflow_file, 'w', encoding='utf-8') as f:
-                        f.write(create_mendix_xml_header())
-                        f.write(format_xml_output(workflow_xml))
-                    
-                    print(f"✅ Generated: {workflow_name}.xml")
-                    generated_count += 1
-                    
-                    # Generate workflow diagram
-                    diagram_file = create_workflow_diagram(workflow_config, output_path)
-                    print(f"📊 Generated workflow diagram: {diagram_file.name}")
-                else:
-                    print(f"❌ Failed to generate XML for {workflow_name}")
-                    
-            except Exception as e:
-                print(f"❌ Error generating {workflow_config.get('name', 'unknown')}: {e}")
-                if args.debug:
-                    import traceback
-                    traceback.print_exc()
+        for workflow_name, error, details in results:
+            log.info("🔨 Generating: %s", workflow_name)
+            if error is None:
+                log.info("✅ Generated: %s.xml", workflow_name)
+                generated_count += 1
+            else:
+                log.error("❌ %s", error)
+                if details:
+                    log.debug(details.rstrip('\n'))
+        
+        # Generate workflow diagram
+        if generated_count:
+            diagram_file = create_workflow_diagram(output_path)
+            log.info("📊 Generated workflow diagram: %s", diagram_file.name)
         
-        print(f"📈 Successfully generated {generated_count} workflows")
+        log.info("📈 Successfully generated %d workflows", generated_count)
     else:
-        print("⚠️ No workflows found in configuration")
+        log.warning("⚠️ No workflows found in configuration")
     
-    print("🎉 Workflow generation completed!")
-    print(f"📁 Files saved to: {output_path.absolute()}")
+    log.info("🎉 Workflow generation completed!")
+    log.info("📁 Files saved to: %s", absolute_output)
     return 0
 
 if __name__ == "__main__":
@@ -400,6 +536,5 @@ if __name__ == "__main__":
         sys.exit(1)
     except Exception as e:
         print(f"❌ Unexpected error: {e}")
-        import traceback
         traceback.print_exc()
         sys.exit(1)
\ No newline at end of file
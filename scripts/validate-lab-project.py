@@ -5,106 +5,217 @@ FIXED VERSION - Validates compatibility with Mendix 10.18.1
 """
 
 import os
+import json
+import mmap
 import sys
-import xml.etree.ElementTree as ET
+from xml.parsers import expat
 import argparse
 from pathlib import Path
 import re
 
-def validate_xml_syntax(file_path):
+# File contents read during this run, keyed by (absolute path, mtime_ns, size) so
+# the compatibility scan reuses bytes the validators already read
+FILE_CACHE = {}
+
+# Compatibility results are cached here between runs; bump the version whenever
+# the checks change so stale results are discarded
+VALIDATION_CACHE_NAME = ".validation-cache.json"
+VALIDATION_CACHE_VERSION = 1
+
+# Security roles that must be generated
+REQUIRED_ROLES = ("LABAdmin", "LABTechnician", "LABViewer")
+
+# Required entities for LAB workflow
+REQUIRED_ENTITIES = (
+    "ProductValidation",
+    "ImageAcquisition",
+    "ImageQualityValidation",
+    "DetailedImageAcquisition",
+    "ImageAnalysis",
+    "KPIExtraction",
+    "ValidationResult",
+    "ValidationReport",
+    "WorkflowAuditTrail"
+)
+
+# Required enumerations
+REQUIRED_ENUMS = (
+    "ValidationStatus",
+    "Priority",
+    "ImageQuality",
+    "WorkflowStage",
+    "ApprovalLevel"
+)
+
+# Core microflows that should exist
+CORE_MICROFLOWS = (
+    "ACT_CreateTask",
+    "ACT_CompleteTask",
+    "ACT_ProcessImageQuality",
+    "SUB_CheckUserPermissions",
+    "DS_GetMyTasks"
+)
+
+# Project directories that must exist
+REQUIRED_DIRS = (
+    "output/domain-model",
+    "output/enumerations",
+    "output/microflows",
+    "output/security",
+    "config"
+)
+
+# Output directories scanned by the compatibility check
+COMPATIBILITY_DIRS = ("domain-model", "microflows", "security", "pages", "workflows")
+
+# Deprecated entity references not compatible with Mendix 10.18.1
+DEPRECATED_ENTITIES = (
+    "System.WorkflowEndedUserTask",  # Only available in Mendix 11+
+    "WorkflowCommons.UserTaskView",  # Deprecated in WF Commons 4.0+
+    "WorkflowCommons.WorkflowView",  # Deprecated in WF Commons 4.0+
+    "WorkflowCommons.MyInitiatedWorkflowView"  # View entity not available
+)
+
+# View entity names that must not appear in XPath constraints, with their lowercase form
+VIEW_ENTITY_PATTERNS = tuple((pattern, pattern.lower()) for pattern in (
+    "WorkflowView",
+    "UserTaskView",
+    "MyInitiatedWorkflowView"
+))
+
+# Mendix 11+ specific features, paired with their lowercase bytes for matching
+MENDIX_11_FEATURES = tuple((feature, feature.lower().encode()) for feature in (
+    "WorkflowEndedUserTask",
+    "View Entities",
+    "view entity",
+    "viewEntity"
+))
+
+# Each union is compiled once and finds every name in a single pass; the
+# lookahead keeps overlapping names (WorkflowView inside MyInitiatedWorkflowView)
+DEPRECATED_ENTITY_RE = re.compile("(?=(" + "|".join(map(re.escape, DEPRECATED_ENTITIES)) + "))")
+MENDIX_11_FEATURE_NAMES = {feature_lower: feature for feature, feature_lower in MENDIX_11_FEATURES}
+MENDIX_11_FEATURE_RE = re.compile(
+    b"(?=(" + b"|".join(re.escape(feature) for _, feature in MENDIX_11_FEATURES) + b"))",
+    re.IGNORECASE
+)
+
+def read_file_bytes(entry):
+    """Read a directory entry's bytes, reusing an earlier read while its mtime and size are unchanged"""
+    # On Windows the listing already carries this stat; on POSIX DirEntry.stat()
+    # makes one stat() call, which is then cached on the entry
+    stat = entry.stat()
+    key = (os.path.abspath(entry.path), stat.st_mtime_ns, stat.st_size)
+    data = FILE_CACHE.get(key)
+    if data is None:
+        with open(entry.path, 'rb') as f:
+            data = FILE_CACHE[key] = f.read()
+    return data
+
+def read_xml_file(entry):
+    """Read a file once, returning its raw bytes and UTF-8 text (or the decode error)"""
+    data = read_file_bytes(entry)
+    try:
+        return data, data.decode('utf-8'), None
+    except UnicodeDecodeError as e:
+        return data, None, e
+
+def validate_xml_syntax(data):
     """Validate XML syntax and return any errors"""
+    # Run expat directly so no tree is built; the namespace separator makes it
+    # reject unbound prefixes exactly as ElementTree does
     try:
-        ET.parse(file_path)
+        expat.ParserCreate(namespace_separator="}").Parse(data, True)
         return True, None
-    except ET.ParseError as e:
+    except expat.ExpatError as e:
         return False, str(e)
 
-def check_entity_references(file_path):
+def check_entity_references(content):
     """Check for deprecated entity references not compatible with Mendix 10.18.1"""
     
-    deprecated_entities = [
-        "System.WorkflowEndedUserTask",  # Only available in Mendix 11+
-        "WorkflowCommons.UserTaskView",  # Deprecated in WF Commons 4.0+
-        "WorkflowCommons.WorkflowView",  # Deprecated in WF Commons 4.0+
-        "WorkflowCommons.MyInitiatedWorkflowView"  # View entity not available
-    ]
-    
-    issues = []
+    found = {match.group(1) for match in DEPRECATED_ENTITY_RE.finditer(content)}
+    issues = [f"Found deprecated entity reference: {deprecated}"
+              for deprecated in DEPRECATED_ENTITIES if deprecated in found]
     
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-            
-        for deprecated in deprecated_entities:
-            if deprecated in content:
-                issues.append(f"Found deprecated entity reference: {deprecated}")
-                
-        return len(issues) == 0, issues
-        
-    except Exception as e:
-        return False, [f"Error reading file: {e}"]
+    return len(issues) == 0, issues
 
-def check_xpath_syntax(file_path):
+def check_xpath_syntax(content):
     """Check XPath constraints for Mendix 10.18.1 compatibility"""
     
     xpath_issues = []
+    lower = content.lower()
     
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-            
-        # Check for proper CurrentUser syntax
-        if "$currentUser" in content.lower():
-            xpath_issues.append("Found '$currentUser' - should be '[%CurrentUser%]' in 10.18.1")
-            
-        if "%currentuser%" in content.lower() and "[%CurrentUser%]" not in content:
-            xpath_issues.append("Found incorrect CurrentUser syntax - use '[%CurrentUser%]'")
-            
-        # Check for View Entity references in XPath
-        view_entity_patterns = [
-            r"WorkflowView",
-            r"UserTaskView", 
-            r"MyInitiatedWorkflowView"
-        ]
+    # Check for proper CurrentUser syntax; the '$' and '%' membership tests on
+    # the original text are cheap and skip the lowercase searches for most files
+    if '$' in content and "$currentuser" in lower:
+        xpath_issues.append("Found '$currentUser' - should be '[%CurrentUser%]' in 10.18.1")
         
-        for pattern in view_entity_patterns:
-            if re.search(pattern, content, re.IGNORECASE):
-                xpath_issues.append(f"Found View Entity reference in XPath: {pattern}")
-                
-        return len(xpath_issues) == 0, xpath_issues
+    if '%' in content and "%currentuser%" in lower and "[%CurrentUser%]" not in content:
+        xpath_issues.append("Found incorrect CurrentUser syntax - use '[%CurrentUser%]'")
         
-    except Exception as e:
-        return False, [f"Error checking XPath syntax: {e}"]
+    # Check for View Entity references in XPath with literal tests on the
+    # lowercased content, which are faster than a case-insensitive regex
+    for pattern, pattern_lower in VIEW_ENTITY_PATTERNS:
+        if pattern_lower in lower:
+            xpath_issues.append(f"Found View Entity reference in XPath: {pattern}")
+    
+    return len(xpath_issues) == 0, xpath_issues
+
+def list_entries(directory):
+    """Map entry names to DirEntry objects from one directory listing, or None if it is missing"""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name: entry for entry in entries}
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+def validate_role_file(entries, role):
+    """Validate a single security role file and return its issues"""
+    file_name = f"{role}.xml"
+    role_file = entries.get(file_name)
+    if role_file is None:
+        return [f"Missing required security role: {role}"]
+    
+    role_issues = []
+    
+    # Read the role file once and run every check on that content
+    data, content, read_error = read_xml_file(role_file)
+    
+    # Validate role file
+    xml_valid, xml_error = validate_xml_syntax(data)
+    if not xml_valid:
+        role_issues.append(f"Invalid XML in {file_name}: {xml_error}")
+    
+    # Undecodable content fails both text checks, each reporting it as before
+    if read_error is not None:
+        role_issues.append(f"{file_name}: Error reading file: {read_error}")
+        role_issues.append(f"{file_name}: Error checking XPath syntax: {read_error}")
+        return role_issues
+    
+    # Check entity references
+    entity_valid, entity_errors = check_entity_references(content)
+    if not entity_valid:
+        role_issues.extend([f"{file_name}: {error}" for error in entity_errors])
+    
+    # Check XPath syntax
+    xpath_valid, xpath_errors = check_xpath_syntax(content)
+    if not xpath_valid:
+        role_issues.extend([f"{file_name}: {error}" for error in xpath_errors])
+    
+    return role_issues
 
 def validate_security_roles(security_dir):
     """Validate security role configurations"""
     
     security_issues = []
-    required_roles = ["LABAdmin", "LABTechnician", "LABViewer"]
     
-    if not security_dir.exists():
+    entries = list_entries(security_dir)
+    if entries is None:
         return False, ["Security directory not found"]
     
     # Check if all required roles exist
-    for role in required_roles:
-        role_file = security_dir / f"{role}.xml"
-        if not role_file.exists():
-            security_issues.append(f"Missing required security role: {role}")
-        else:
-            # Validate role file
-            xml_valid, xml_error = validate_xml_syntax(role_file)
-            if not xml_valid:
-                security_issues.append(f"Invalid XML in {role}.xml: {xml_error}")
-            
-            # Check entity references
-            entity_valid, entity_errors = check_entity_references(role_file)
-            if not entity_valid:
-                security_issues.extend([f"{role}.xml: {error}" for error in entity_errors])
-            
-            # Check XPath syntax
-            xpath_valid, xpath_errors = check_xpath_syntax(role_file)
-            if not xpath_valid:
-                security_issues.extend([f"{role}.xml: {error}" for error in xpath_errors])
+    for role in REQUIRED_ROLES:
+        security_issues.extend(validate_role_file(entries, role))
     
     return len(security_issues) == 0, security_issues
 
@@ -113,90 +224,80 @@ def validate_domain_model(domain_dir, enum_dir):
     
     domain_issues = []
     
-    if not domain_dir.exists():
+    entity_entries = list_entries(domain_dir)
+    if entity_entries is None:
         return False, ["Domain model directory not found"]
     
-    if not enum_dir.exists():
+    enum_entries = list_entries(enum_dir)
+    if enum_entries is None:
         return False, ["Enumerations directory not found"]
     
-    # Required entities for LAB workflow
-    required_entities = [
-        "ProductValidation",
-        "ImageAcquisition", 
-        "ImageQualityValidation",
-        "DetailedImageAcquisition",
-        "ImageAnalysis",
-        "KPIExtraction",
-        "ValidationResult",
-        "ValidationReport",
-        "WorkflowAuditTrail"
-    ]
-    
     # Check required entities
-    for entity in required_entities:
-        entity_file = domain_dir / f"{entity}.xml"
-        if not entity_file.exists():
+    for entity in REQUIRED_ENTITIES:
+        file_name = f"{entity}.xml"
+        entity_file = entity_entries.get(file_name)
+        if entity_file is None:
             domain_issues.append(f"Missing required entity: {entity}")
         else:
             # Validate XML syntax
-            xml_valid, xml_error = validate_xml_syntax(entity_file)
+            xml_valid, xml_error = validate_xml_syntax(read_file_bytes(entity_file))
             if not xml_valid:
-                domain_issues.append(f"Invalid XML in {entity}.xml: {xml_error}")
-    
-    # Required enumerations
-    required_enums = [
-        "ValidationStatus",
-        "Priority", 
-        "ImageQuality",
-        "WorkflowStage",
-        "ApprovalLevel"
-    ]
+                domain_issues.append(f"Invalid XML in {file_name}: {xml_error}")
     
     # Check required enumerations
-    for enum in required_enums:
-        enum_file = enum_dir / f"{enum}.xml"
-        if not enum_file.exists():
+    for enum in REQUIRED_ENUMS:
+        file_name = f"{enum}.xml"
+        enum_file = enum_entries.get(file_name)
+        if enum_file is None:
             domain_issues.append(f"Missing required enumeration: {enum}")
         else:
             # Validate XML syntax
-            xml_valid, xml_error = validate_xml_syntax(enum_file)
+            xml_valid, xml_error = validate_xml_syntax(read_file_bytes(enum_file))
             if not xml_valid:
-                domain_issues.append(f"Invalid XML in {enum}.xml: {xml_error}")
+                domain_issues.append(f"Invalid XML in {file_name}: {xml_error}")
     
     return len(domain_issues) == 0, domain_issues
 
+def validate_microflow_file(entries, microflow):
+    """Validate a single core microflow file and return its issues"""
+    file_name = f"{microflow}.xml"
+    microflow_file = entries.get(file_name)
+    if microflow_file is None:
+        return [f"Missing core microflow: {microflow}"]
+    
+    microflow_issues = []
+    
+    # Read the microflow once for both checks
+    data, content, read_error = read_xml_file(microflow_file)
+    
+    # Validate XML syntax
+    xml_valid, xml_error = validate_xml_syntax(data)
+    if not xml_valid:
+        microflow_issues.append(f"Invalid XML in {file_name}: {xml_error}")
+    
+    if read_error is not None:
+        microflow_issues.append(f"{file_name}: Error reading file: {read_error}")
+        return microflow_issues
+    
+    # Check entity references
+    entity_valid, entity_errors = check_entity_references(content)
+    if not entity_valid:
+        microflow_issues.extend([f"{file_name}: {error}" for error in entity_errors])
+    
+    return microflow_issues
+
 def validate_microflows(microflows_dir):
     """Validate microflow definitions"""
     
     microflow_issues = []
     
-    if not microflows_dir.exists():
+    entries = list_entries(microflows_dir)
+    if entries is None:
         return False, ["Microflows directory not found"]
     
-    # Core microflows that should exist
-    core_microflows = [
-        "ACT_CreateTask",
-        "ACT_CompleteTask",
-        "ACT_ProcessImageQuality",
-        "SUB_CheckUserPermissions",
-        "DS_GetMyTasks"
-    ]
-    
     # Check core microflows
-    for microflow in core_microflows:
-        microflow_file = microflows_dir / f"{microflow}.xml"
-        if not microflow_file.exists():
-            microflow_issues.append(f"Missing core microflow: {microflow}")
-        else:
-            # Validate XML syntax
-            xml_valid, xml_error = validate_xml_syntax(microflow_file)
-            if not xml_valid:
-                microflow_issues.append(f"Invalid XML in {microflow}.xml: {xml_error}")
-            
-            # Check entity references
-            entity_valid, entity_errors = check_entity_references(microflow_file)
-            if not entity_valid:
-                microflow_issues.extend([f"{microflow}.xml: {error}" for error in entity_errors])
+    for microflow in CORE_MICROFLOWS:
+        microflow_issues.extend(validate_microflow_file(entries, microflow))
     
     return len(microflow_issues) == 0, microflow_issues
 
@@ -204,72 +305,158 @@ def validate_project_structure(base_dir):
     """Validate overall project structure"""
     
     structure_issues = []
+    base = os.fspath(base_dir)
     
-    required_dirs = [
-        "output/domain-model",
-        "output/enumerations", 
-        "output/microflows",
-        "output/security",
-        "config"
-    ]
-    
-    for dir_path in required_dirs:
-        full_path = base_dir / dir_path
-        if not full_path.exists():
+    for dir_path in REQUIRED_DIRS:
+        if not os.path.isdir(os.path.join(base, dir_path)):
             structure_issues.append(f"Missing required directory: {dir_path}")
     
     # Check config file
-    config_file = base_dir / "config/lab-workflow-config.yaml"
-    if not config_file.exists():
+    if not os.path.isfile(os.path.join(base, "config/lab-workflow-config.yaml")):
         structure_issues.append("Missing configuration file: config/lab-workflow-config.yaml")
     
     return len(structure_issues) == 0, structure_issues
 
-def check_mendix_compatibility(base_dir):
+def scan_compatibility(name, content, all_issues=True):
+    """Scan raw file bytes (or a mapping of them) for Mendix 10.18.1 compatibility issues"""
+    file_issues = []
+    
+    # Check for Mendix 11+ specific features; unless every issue is
+    # wanted, the first hit is enough to mark the file incompatible
+    if all_issues:
+        found = {match.group(1).lower() for match in MENDIX_11_FEATURE_RE.finditer(content)}
+        for feature, feature_lower in MENDIX_11_FEATURES:
+            if feature_lower in found:
+                file_issues.append(f"{name}: Contains Mendix 11+ feature: {feature}")
+    else:
+        match = MENDIX_11_FEATURE_RE.search(content)
+        if match is not None:
+            feature = MENDIX_11_FEATURE_NAMES[match.group(1).lower()]
+            file_issues.append(f"{name}: Contains Mendix 11+ feature: {feature}")
+            return file_issues
+    
+    # Check for proper XML namespaces
+    if content.find(b"http://www.mendix.com/metamodel/") != -1:
+        # Ensure version compatibility
+        if content.find(b"/8.0.0") != -1 or content.find(b"/9.0.0") != -1:
+            file_issues.append(f"{name}: Uses newer XML schema version")
+    
+    return file_issues
+
+def check_compatibility_file(xml_file, all_issues=True):
+    """Check a single XML file for Mendix 10.18.1 compatibility issues"""
+    name = xml_file.name
+    
+    try:
+        # Files already read by the earlier validators are scanned from the cache
+        stat = xml_file.stat()
+        data = FILE_CACHE.get((os.path.abspath(xml_file.path), stat.st_mtime_ns, stat.st_size))
+        if data is not None:
+            return scan_compatibility(name, data, all_issues)
+        
+        # mmap cannot map an empty file, which has nothing to report anyway
+        if stat.st_size == 0:
+            return []
+        
+        # Scan the mapped bytes in place; every pattern is ASCII, so no decode is needed
+        with open(xml_file.path, 'rb') as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+            return scan_compatibility(name, content, all_issues)
+            
+    except Exception as e:
+        return [f"Error checking {name}: {e}"]
+
+def load_validation_cache(cache_file):
+    """Load per-file compatibility results from a previous run"""
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    
+    if not isinstance(cache, dict) or cache.get('version') != VALIDATION_CACHE_VERSION:
+        return {}
+    files = cache.get('files')
+    return files if isinstance(files, dict) else {}
+
+def save_validation_cache(cache_file, files):
+    """Store per-file compatibility results for the next run"""
+    try:
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump({'version': VALIDATION_CACHE_VERSION, 'files': files}, f)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        pass  # Caching is best-effort
+
+def check_mendix_compatibility(base_dir, all_issues=True):
     """Check specific Mendix 10.18.1 compatibility issues"""
     
     compatibility_issues = []
     
-    # Check all XML files for compatibility issues
+    # Check all XML files for compatibility issues; DirEntry caches the file
+    # type from the directory listing, so no extra stat per entry is needed
     xml_files = []
-    for dir_name in ["domain-model", "microflows", "security", "pages", "workflows"]:
-        xml_dir = base_dir / "output" / dir_name
-        if xml_dir.exists():
-            xml_files.extend(xml_dir.glob("*.xml"))
-    
-    for xml_file in xml_files:
+    for dir_name in COMPATIBILITY_DIRS:
         try:
-            with open(xml_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Check for Mendix 11+ specific features
-            mendix_11_features = [
-                "WorkflowEndedUserTask",
-                "View Entities",
-                "view entity",
-                "viewEntity"
-            ]
-            
-            for feature in mendix_11_features:
-                if feature.lower() in content.lower():
-                    compatibility_issues.append(f"{xml_file.name}: Contains Mendix 11+ feature: {feature}")
-            
-            # Check for proper XML namespaces
-            if "http://www.mendix.com/metamodel/" in content:
-                # Ensure version compatibility
-                if "/8.0.0" in content or "/9.0.0" in content:
-                    compatibility_issues.append(f"{xml_file.name}: Uses newer XML schema version")
-                    
-        except Exception as e:
-            compatibility_issues.append(f"Error checking {xml_file.name}: {e}")
+            with os.scandir(base_dir / "output" / dir_name) as entries:
+                xml_files.extend(entry for entry in entries
+                                 if entry.name.endswith('.xml') and entry.is_file())
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+    
+    # Reuse results for files whose mtime and size match the previous run; the
+    # cache sits in the project root so it is never packaged with output/
+    cache_file = base_dir / VALIDATION_CACHE_NAME
+    cached_files = load_validation_cache(cache_file)
+    current_files = {}
+    results = [None] * len(xml_files)
+    pending = []
+    
+    for index, xml_file in enumerate(xml_files):
+        try:
+            stat = xml_file.stat()
+        except OSError:
+            pending.append((index, xml_file, None))
+            continue
+        
+        key = [stat.st_mtime_ns, stat.st_size, all_issues]
+        cached = cached_files.get(xml_file.path)
+        if cached is not None and cached[0] == key:
+            results[index] = cached[1]
+            current_files[xml_file.path] = cached
+        else:
+            pending.append((index, xml_file, key))
+    
+    for index, xml_file, key in pending:
+        file_issues = check_compatibility_file(xml_file, all_issues)
+        results[index] = file_issues
+        if key is not None:
+            current_files[xml_file.path] = [key, file_issues]
+    
+    for file_issues in results:
+        compatibility_issues.extend(file_issues)
+    
+    if xml_files:
+        save_validation_cache(cache_file, current_files)
     
     return len(compatibility_issues) == 0, compatibility_issues
 
+def report_section(valid, issues, passed_message, issues_title):
+    """Print one validator's outcome with a single write and return its issue count"""
+    if valid:
+        print(f"  ✅ {passed_message}")
+        return 0
+    print("\n".join([f"  ❌ {issues_title}:", *(f"    • {issue}" for issue in issues)]))
+    return len(issues)
+
 def main():
     parser = argparse.ArgumentParser(description="Validate LAB Workflow Project")
     parser.add_argument("--output", default="output", help="Output directory to validate")
     parser.add_argument("--comprehensive", action="store_true", help="Run comprehensive validation")
     parser.add_argument("--verbose", action="store_true", help="Verbose output")
+    parser.add_argument("--all-issues", action="store_true",
+                        help="Report every compatibility issue per file, not just the first")
     
     args = parser.parse_args()
     
@@ -282,22 +469,15 @@ def main():
     print(f"🎯 Target: Mendix 10.18.1 + Workflow Commons 3.12.1")
     print()
     
-    all_passed = True
     total_issues = 0
     
     # 1. Validate project structure
     print("📋 Validating project structure...")
     structure_valid, structure_issues = validate_project_structure(base_dir)
-    if structure_valid:
-        print("  ✅ Project structure is valid")
-    else:
-        print("  ❌ Project structure issues:")
-        for issue in structure_issues:
-            print(f"    • {issue}")
-        all_passed = False
-        total_issues += len(structure_issues)
+    total_issues += report_section(structure_valid, structure_issues,
+                                   "Project structure is valid", "Project structure issues")
     
-    if not output_dir.exists():
+    if not os.path.isdir(output_dir):
         print(f"❌ Output directory not found: {output_dir}")
         print("Run the generation script first!")
         sys.exit(1)
@@ -308,53 +488,32 @@ def main():
         output_dir / "domain-model",
         output_dir / "enumerations"
     )
-    if domain_valid:
-        print("  ✅ Domain model is valid")
-    else:
-        print("  ❌ Domain model issues:")
-        for issue in domain_issues:
-            print(f"    • {issue}")
-        all_passed = False
-        total_issues += len(domain_issues)
+    total_issues += report_section(domain_valid, domain_issues,
+                                   "Domain model is valid", "Domain model issues")
     
     # 3. Validate microflows
     print("\n⚡ Validating microflows...")
     microflows_valid, microflow_issues = validate_microflows(output_dir / "microflows")
-    if microflows_valid:
-        print("  ✅ Microflows are valid")
-    else:
-        print("  ❌ Microflow issues:")
-        for issue in microflow_issues:
-            print(f"    • {issue}")
-        all_passed = False
-        total_issues += len(microflow_issues)
+    total_issues += report_section(microflows_valid, microflow_issues,
+                                   "Microflows are valid", "Microflow issues")
     
     # 4. Validate security roles
     print("\n🔒 Validating security roles...")
     security_valid, security_issues = validate_security_roles(output_dir / "security")
-    if security_valid:
-        print("  ✅ Security roles are valid")
-    else:
-        print("  ❌ Security role issues:")
-        for issue in security_issues:
-            print(f"    • {issue}")
-        all_passed = False
-        total_issues += len(security_issues)
+    total_issues += report_section(security_valid, security_issues,
+                                   "Security roles are valid", "Security role issues")
     
     # 5. Check Mendix compatibility
     if args.comprehensive:
         print("\n🎯 Checking Mendix 10.18.1 compatibility...")
-        compat_valid, compat_issues = check_mendix_compatibility(base_dir)
-        if compat_valid:
-            print("  ✅ Mendix 10.18.1 compatibility verified")
-        else:
-            print("  ❌ Compatibility issues:")
-            for issue in compat_issues:
-                print(f"    • {issue}")
-            all_passed = False
-            total_issues += len(compat_issues)
+        compat_valid, compat_issues = check_mendix_compatibility(
+            base_dir, all_issues=args.verbose or args.all_issues
+        )
+        total_issues += report_section(compat_valid, compat_issues,
+                                       "Mendix 10.18.1 compatibility verified", "Compatibility issues")
     
     # Final summary
+    all_passed = total_issues == 0
     print("\n" + "=" * 60)
     if all_passed:
         print("🎉 ALL VALIDATIONS PASSED!")
@@ -380,41 +539,33 @@ def main():
     # Generate validation report if verbose
     if args.verbose:
         report_file = output_dir / "VALIDATION_REPORT.txt"
-        with open(report_file, 'w', encoding='utf-8') as f:
-            f.write("LAB Workflow Project Validation Report\n")
-            f.write("=" * 50 + "\n\n")
-            f.write(f"Validation Date: {Path().resolve()}\n")
-            f.write(f"Target Platform: Mendix 10.18.1\n")
-            f.write(f"Workflow Commons: 3.12.1\n\n")
+        
+        # Collect the report in memory and write it with a single call
+        report = [
+            "LAB Workflow Project Validation Report\n",
+            "=" * 50 + "\n\n",
+            f"Validation Date: {Path().resolve()}\n",
+            "Target Platform: Mendix 10.18.1\n",
+            "Workflow Commons: 3.12.1\n\n"
+        ]
+        
+        if all_passed:
+            report.append("✅ ALL VALIDATIONS PASSED\n\n")
+        else:
+            report.append(f"❌ VALIDATION FAILED - {total_issues} issues\n\n")
             
-            if all_passed:
-                f.write("✅ ALL VALIDATIONS PASSED\n\n")
-            else:
-                f.write(f"❌ VALIDATION FAILED - {total_issues} issues\n\n")
-                
-                if structure_issues:
-                    f.write("Structure Issues:\n")
-                    for issue in structure_issues:
-                        f.write(f"  • {issue}\n")
-                    f.write("\n")
-                    
-                if domain_issues:
-                    f.write("Domain Model Issues:\n")
-                    for issue in domain_issues:
-                        f.write(f"  • {issue}\n")
-                    f.write("\n")
-                    
-                if microflow_issues:
-                    f.write("Microflow Issues:\n")
-                    for issue in microflow_issues:
-                        f.write(f"  • {issue}\n")
-                    f.write("\n")
-                    
-                if security_issues:
-                    f.write("Security Issues:\n")
-                    for issue in security_issues:
-                        f.write(f"  • {issue}\n")
-                    f.write("\n")
+            for title, issues in (("Structure Issues", structure_issues),
+                                  ("Domain Model Issues", domain_issues),
+                                  ("Microflow Issues", microflow_issues),
+                                  ("Security Issues", security_issues)):
+                if issues:
+                    report.append(f"{title}:\n")
+                    report.extend(f"  • {issue}\n" for issue in issues)
+                    report.append("\n")
+        
+        # Text mode keeps the platform's line endings (CRLF on Windows)
+        with open(report_file, 'w', encoding='utf-8') as f:
+            f.write("".join(report))
         
         print(f"📄 Detailed validation report: {report_file}")
     